@@ -1,15 +1,69 @@
 import asyncio
+import hashlib
+import math
 import os
+import random
 import re
-from typing import Optional
+from collections import OrderedDict, deque
+from typing import AsyncIterator, Optional, Sequence
 
 import aiohttp
 import discord
 from discord.ext import commands
 from logger import setup_logger
+from utils.formatting import smart_chunk
+from utils.serialization import json_dumps, json_loads
 
 logger = setup_logger("AIResponse")
 
+# Semantic response cache, grouped by conversation context (the last turn,
+# or none for a standalone prompt): max contexts, max stored prompts per
+# context, and the minimum cosine similarity for a cached answer to be
+# reused. bge scores cluster high, so the threshold is kept strict.
+SEMANTIC_CACHE_CONTEXTS = 512
+SEMANTIC_CACHE_SIZE = 32
+SEMANTIC_CACHE_THRESHOLD = 0.95
+
+# Exact-match cache on the prompt plus a digest of the last turn
+RESPONSE_CACHE_SIZE = 512
+
+# Per-user conversation history kept in memory
+HISTORY_CACHE_USERS = 2048
+HISTORY_TURNS = 6
+# Roughly 1500 tokens of history + prompt per request
+HISTORY_CHAR_BUDGET = 6000
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Rate limits and transient server errors worth retrying
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Minimum seconds between edits while streaming a reply
+STREAM_EDIT_INTERVAL = 1.0
+# Max chat and embedding requests in flight at once, to stay clear of rate
+# limits
+API_CONCURRENCY = 8
+
+# Static system prompt, shared by every request
+SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": (
+        "You're a helpful, witty, and engaging assistant in a casual Discord chat. "
+        "Your personality traits:\n"
+        "- Genuine and thoughtful in your responses\n"
+        "- Use natural conversational language and contractions\n"
+        "- Be funny, sarcastic, or charming when it fits naturally\n"
+        "- Ask follow-up questions to keep conversations interesting\n"
+        "- Admit when you don't know something instead of guessing\n"
+        "- Give realistic, balanced answers—not always the 'perfect' response\n"
+        "- Be concise but not robotic; write like a real person\n"
+        "- Match the user's tone and energy when appropriate\n"
+        "- Use context from the conversation to give better replies\n\n"
+        "Keep responses focused and under 400 words when possible. "
+        "If responding to questions, be thorough but readable."
+    ),
+}
+
 
 class AIResponse(commands.Cog):
     """AI chatbot that responds to direct mentions in Discord."""
@@ -19,6 +73,7 @@ class AIResponse(commands.Cog):
         self.api_key = os.getenv("WORKERS_API_KEY")
         self.account_id = os.getenv("WORKERS_ACCOUNT_ID")
         self.model = "@cf/meta/llama-3-8b-instruct"
+        self.embedding_model = "@cf/baai/bge-small-en-v1.5"
         self.api_base = (
             f"https://api.cloudflare.com/client/v4/accounts/{self.account_id}/ai/run/"
         )
@@ -26,9 +81,76 @@ class AIResponse(commands.Cog):
         # Typing timeout to show bot is thinking
         self.typing_timeout = 15
 
+        # Connection pool sizing for concurrent mentions
+        self.pool_limit = int(os.getenv("AI_POOL_LIMIT", "64"))
+        self.pool_limit_per_host = int(os.getenv("AI_POOL_LIMIT_PER_HOST", "64"))
+        self.dns_cache_ttl = int(os.getenv("AI_DNS_CACHE_TTL", "600"))
+        self.keepalive_timeout = float(os.getenv("AI_KEEPALIVE_TIMEOUT", "75"))
+
+        # Shared HTTP session, created in cog_load so keep-alive connections
+        # to Cloudflare are reused across mentions
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._warmup_task: Optional[asyncio.Task] = None
+
+        # Strong references to fire-and-forget tasks so they aren't GC'd
+        self._bg_tasks: set[asyncio.Task] = set()
+        self._api_sem = asyncio.Semaphore(API_CONCURRENCY)
+
+        # Mention strings and pattern, built on first use once bot.user is known
+        self._mention_str: Optional[str] = None
+        self._mention_str_nick: Optional[str] = None
+        self._mention_re: Optional[re.Pattern] = None
+
+        # User ID -> recent (user_message, bot_response) turns, in LRU order
+        self._history_cache: OrderedDict[int, deque[tuple[str, str]]] = OrderedDict()
+
+        # Hash of the context digest and prompt -> response, in LRU order
+        self._response_cache: OrderedDict[bytes, str] = OrderedDict()
+
+        # Context digest -> normalized prompt -> (unit embedding, response),
+        # both in LRU order
+        self._semantic_cache: OrderedDict[
+            bytes, OrderedDict[str, tuple[list[float], str]]
+        ] = OrderedDict()
+
         if not self.api_key or not self.account_id:
             logger.error("Missing WORKERS_API_KEY or WORKERS_ACCOUNT_ID in environment")
 
+    async def cog_load(self):
+        """Create the shared HTTP session used for all API calls."""
+        self._session = aiohttp.ClientSession(
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            timeout=aiohttp.ClientTimeout(total=30),
+            connector=aiohttp.TCPConnector(
+                limit=self.pool_limit,
+                limit_per_host=self.pool_limit_per_host,
+                use_dns_cache=True,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_timeout,
+                enable_cleanup_closed=True,
+            ),
+        )
+        # Open the first connection in the background so the initial mention
+        # doesn't pay for DNS + TCP + TLS setup
+        self._warmup_task = asyncio.create_task(self._warm_connection())
+
+    async def _warm_connection(self):
+        """Prime the connection pool with a cheap HEAD request."""
+        try:
+            async with self._session.head(self.api_base, allow_redirects=False):
+                pass
+            logger.debug("Warmed connection to Cloudflare Workers AI")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.debug(f"Connection warm-up failed: {e}")
+
+    async def cog_unload(self):
+        """Close the shared HTTP session."""
+        if self._warmup_task and not self._warmup_task.done():
+            self._warmup_task.cancel()
+        if self._session:
+            await self._session.close()
+            self._session = None
+
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
         """Listen for messages and respond if bot is mentioned."""
@@ -36,16 +158,21 @@ class AIResponse(commands.Cog):
         if message.author.bot:
             return
 
-        # Ignore if no mentions at all
-        if not message.mentions:
-            return
-
-        # Check if THIS BOT was mentioned
-        if self.bot.user not in message.mentions:
-            return
+        # Ignore anything that doesn't mention THIS BOT. A substring check on
+        # the raw content is enough for typed mentions; only replies (which can
+        # ping without a mention in the text) need the parsed mentions list.
+        if self._mention_re is None:
+            self._init_mention_patterns()
+        content = message.content
+        if self._mention_str not in content and self._mention_str_nick not in content:
+            bot_id = self.bot.user.id
+            if message.reference is None or not any(
+                m.id == bot_id for m in message.mentions
+            ):
+                return
 
         # Extract the message content, removing the bot mention
-        user_input = self._clean_mention(message.content, self.bot.user.id)
+        user_input = self._clean_mention(content)
 
         if not user_input:
             await message.reply(
@@ -57,12 +184,21 @@ class AIResponse(commands.Cog):
         async with message.channel.typing():
             try:
                 # Get conversation history
-                history = await self.bot.database.ai_db.get_user_history(
-                    message.author.id
-                )
-
-                # Generate AI response
-                response = await self.generate_ai_response(user_input, history)
+                history = await self._get_history(message.author.id)
+
+                # Stream the AI response, editing the reply as text arrives
+                replies: list[discord.Message] = []
+                response = None
+                last_edit = 0.0
+
+                async for response in self.generate_ai_response_stream(
+                    user_input, history
+                ):
+                    now = asyncio.get_running_loop().time()
+                    if replies and now - last_edit < STREAM_EDIT_INTERVAL:
+                        continue
+                    await self._render_reply(message, replies, response)
+                    last_edit = now
 
                 if not response:
                     await message.reply(
@@ -70,14 +206,19 @@ class AIResponse(commands.Cog):
                     )
                     return
 
-                # Log the interaction
-                await self.bot.database.ai_db.log_interaction(
-                    message.author.id, user_input, response
-                )
+                # Make sure the final text is shown
+                await self._render_reply(message, replies, response)
 
-                # Send response in chunks if needed
-                for chunk in self.smart_chunk(response):
-                    await message.reply(chunk, mention_author=False)
+                # Log the interaction without holding up the reply
+                task = asyncio.create_task(
+                    self._safe_log(message.author.id, user_input, response)
+                )
+                self._bg_tasks.add(task)
+                task.add_done_callback(self._bg_tasks.discard)
+                if message.author.id in self._history_cache:
+                    self._history_cache[message.author.id].append(
+                        (user_input, response)
+                    )
 
             except Exception as e:
                 logger.error(f"Error generating AI response: {e}", exc_info=True)
@@ -85,84 +226,238 @@ class AIResponse(commands.Cog):
                     "💥 Oops, something went wrong. Try again in a moment?"
                 )
 
-    def _clean_mention(self, content: str, bot_id: int) -> str:
-        """
-        Remove bot mention from message content.
-        Handles both <@bot_id> and <@!bot_id> formats.
+    async def _render_reply(
+        self, message: discord.Message, replies: list[discord.Message], text: str
+    ) -> None:
         """
-        # Remove mention patterns
-        content = re.sub(rf"<@!?{bot_id}>", "", content)
-        return content.strip()
+        Show the current response text, splitting it across as many replies
+        as needed and only editing replies whose chunk changed.
 
-    def smart_chunk(self, text: str, max_length: int = 2000) -> list[str]:
-        """
-        Split text into chunks for Discord (2000 char limit).
-        Tries to break on logical boundaries (sentences, paragraphs).
+        Args:
+            message: Message being replied to
+            replies: Replies sent so far (updated in place)
+            text: Response text generated so far
         """
-        if len(text) <= max_length:
-            return [text]
-
-        chunks = []
-        current_chunk = ""
-
-        # Split by paragraphs first
-        paragraphs = text.split("\n\n")
-
-        for paragraph in paragraphs:
-            # If a single paragraph is too long, split by sentences
-            if len(paragraph) > max_length:
-                sentences = re.split(r"(?<=[.!?])\s+", paragraph)
-                for sentence in sentences:
-                    if len(current_chunk) + len(sentence) + 2 <= max_length:
-                        current_chunk += sentence + " "
-                    else:
-                        if current_chunk:
-                            chunks.append(current_chunk.strip())
-                        current_chunk = sentence + " "
+        for i, chunk in enumerate(smart_chunk(text)):
+            if i < len(replies):
+                if replies[i].content != chunk:
+                    replies[i] = await replies[i].edit(content=chunk)
             else:
-                if len(current_chunk) + len(paragraph) + 2 <= max_length:
-                    current_chunk += paragraph + "\n\n"
-                else:
-                    if current_chunk:
-                        chunks.append(current_chunk.strip())
-                    current_chunk = paragraph + "\n\n"
+                replies.append(await message.reply(chunk, mention_author=False))
+
+    async def _safe_log(self, user_id: int, user_input: str, response: str) -> None:
+        """Log an interaction to the database, swallowing any errors."""
+        try:
+            await self.bot.database.ai_db.log_interaction(user_id, user_input, response)
+        except Exception as e:
+            logger.error(f"Error logging AI interaction: {e}", exc_info=True)
 
-        if current_chunk:
-            chunks.append(current_chunk.strip())
+    async def _get_history(self, user_id: int) -> deque[tuple[str, str]]:
+        """
+        Get a user's recent conversation turns, loading from the DB on a miss.
+
+        Args:
+            user_id: Discord user ID
+
+        Returns:
+            Deque of (user_message, bot_response) tuples, oldest first
+        """
+        history = self._history_cache.get(user_id)
+        if history is not None:
+            self._history_cache.move_to_end(user_id)
+            return history
 
-        return chunks
+        rows = await self.bot.database.ai_db.get_user_history(
+            user_id, limit=HISTORY_TURNS
+        )
+        history = deque(((row[0], row[1]) for row in rows or []), maxlen=HISTORY_TURNS)
+        self._history_cache[user_id] = history
+        if len(self._history_cache) > HISTORY_CACHE_USERS:
+            self._history_cache.popitem(last=False)
+        return history
 
-    async def generate_ai_response(
-        self, user_input: str, history: list[tuple[str, str]]
-    ) -> Optional[str]:
+    def _clean_mention(self, content: str) -> str:
+        """
+        Remove bot mention from message content.
+        Handles both <@bot_id> and <@!bot_id> formats.
+        """
+        if self._mention_re is None:
+            self._init_mention_patterns()
+        return self._mention_re.sub("", content).strip()
+
+    def _init_mention_patterns(self) -> None:
+        """Build the mention strings and pattern once the bot ID is known."""
+        bot_id = self.bot.user.id
+        self._mention_str = f"<@{bot_id}>"
+        self._mention_str_nick = f"<@!{bot_id}>"
+        self._mention_re = re.compile(rf"<@!?{bot_id}>")
+
+    async def generate_ai_response_stream(
+        self,
+        user_input: str,
+        history: Sequence[tuple[str, str]],
+    ) -> AsyncIterator[str]:
         """
-        Generate AI response using Cloudflare Workers AI.
+        Generate AI response using Cloudflare Workers AI, streamed.
 
         Args:
             user_input: User's message
             history: List of (user_message, bot_response) tuples
 
-        Returns:
-            AI-generated response or None if error
+        Yields:
+            The response text generated so far; nothing if the request failed
+            before any text arrived
+
+        Raises:
+            Exception: If the stream fails after text has been yielded, so a
+                partial response isn't mistaken for a finished one
         """
+        streamed = False
         try:
             # Build conversation messages
             messages = self._build_messages(user_input, history)
 
+            # Same prompt seen recently in the same context: skip the API
+            # entirely. Only the last turn is keyed, not the whole history, so
+            # a repeated follow-up can hit even when older turns differ.
+            context = self._context_digest(history)
+            cache_key = hashlib.blake2b(
+                context + user_input.encode(), digest_size=16
+            ).digest()
+            cached = self._response_cache.get(cache_key)
+            if cached:
+                self._response_cache.move_to_end(cache_key)
+                logger.info(f"✅ AI Response served from cache: {len(cached)} chars")
+                yield cached
+                return
+
+            # Reuse the answer to a near-identical prompt asked in the same
+            # context. The embedding is only fetched once the exact cache misses.
+            embedding = await self._embed(user_input)
+            if embedding:
+                cached = self._semantic_lookup(context, embedding)
+                if cached:
+                    logger.info(
+                        f"✅ AI Response served from cache: {len(cached)} chars"
+                    )
+                    yield cached
+                    return
+
             # Make API request
-            response = await self._call_api(messages)
+            response = None
+            async for response in self._stream_api(messages):
+                streamed = True
+                yield response
 
             if response:
                 logger.info(f"✅ AI Response generated: {len(response)} chars")
-
-            return response
+                self._response_cache[cache_key] = response
+                if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                    self._response_cache.popitem(last=False)
+                if embedding:
+                    self._semantic_store(context, user_input, embedding, response)
 
         except Exception as e:
+            if streamed:
+                raise
             logger.error(f"Error generating AI response: {e}", exc_info=True)
+
+    async def _embed(self, text: str) -> Optional[list[float]]:
+        """
+        Embed text with the Workers AI embedding model.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Unit-length embedding vector or None if unavailable
+        """
+        try:
+            async with self._api_sem:
+                async with self._session.post(
+                    f"{self.api_base}{self.embedding_model}",
+                    data=json_dumps({"text": [text]}),
+                    headers=JSON_HEADERS,
+                ) as response:
+                    if response.status != 200:
+                        logger.debug(f"Embedding request failed: {response.status}")
+                        return None
+                    json_data = json_loads(await response.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.debug(f"Embedding request failed: {e}")
+            return None
+
+        vectors = json_data.get("result", {}).get("data") or []
+        if not vectors:
+            return None
+
+        vector = vectors[0]
+        norm = math.sqrt(sum(x * x for x in vector))
+        if not norm:
+            return None
+        return [x / norm for x in vector]
+
+    @staticmethod
+    def _context_digest(history: Sequence[tuple[str, str]]) -> bytes:
+        """
+        Digest the last conversation turn, or b"" for a standalone prompt.
+        Cached answers are only reused under the same digest, so a follow-up
+        like "why?" never gets an answer written for another conversation.
+        """
+        if not history:
+            return b""
+        return hashlib.blake2b(json_dumps(history[-1]), digest_size=16).digest()
+
+    def _semantic_lookup(self, context: bytes, embedding: list[float]) -> Optional[str]:
+        """
+        Find a cached response, asked in the same context, whose prompt is
+        similar enough to the embedding. At most SEMANTIC_CACHE_SIZE entries
+        are scanned.
+
+        Args:
+            context: Digest from _context_digest
+            embedding: Unit-length embedding of the current prompt
+
+        Returns:
+            Cached response or None on a miss
+        """
+        entries = self._semantic_cache.get(context)
+        if not entries:
             return None
 
+        best_key, best_score = None, SEMANTIC_CACHE_THRESHOLD
+        for key, (vector, _) in entries.items():
+            score = sum(a * b for a, b in zip(embedding, vector))
+            if score >= best_score:
+                best_key, best_score = key, score
+
+        if best_key is None:
+            return None
+
+        self._semantic_cache.move_to_end(context)
+        entries.move_to_end(best_key)
+        return entries[best_key][1]
+
+    def _semantic_store(
+        self, context: bytes, user_input: str, embedding: list[float], response: str
+    ) -> None:
+        """Cache a response under its context and prompt embedding, evicting the oldest."""
+        entries = self._semantic_cache.get(context)
+        if entries is None:
+            entries = self._semantic_cache[context] = OrderedDict()
+            if len(self._semantic_cache) > SEMANTIC_CACHE_CONTEXTS:
+                self._semantic_cache.popitem(last=False)
+        else:
+            self._semantic_cache.move_to_end(context)
+
+        key = user_input.strip().lower()
+        entries[key] = (embedding, response)
+        entries.move_to_end(key)
+        if len(entries) > SEMANTIC_CACHE_SIZE:
+            entries.popitem(last=False)
+
     def _build_messages(
-        self, user_input: str, history: list[tuple[str, str]]
+        self, user_input: str, history: Sequence[tuple[str, str]]
     ) -> list[dict]:
         """
         Build the message list for the API, including conversation history.
@@ -174,108 +469,147 @@ class AIResponse(commands.Cog):
         Returns:
             List of message dicts with role and content
         """
-        messages = [
-            {
-                "role": "system",
-                "content": (
-                    "You're a helpful, witty, and engaging assistant in a casual Discord chat. "
-                    "Your personality traits:\n"
-                    "- Genuine and thoughtful in your responses\n"
-                    "- Use natural conversational language and contractions\n"
-                    "- Be funny, sarcastic, or charming when it fits naturally\n"
-                    "- Ask follow-up questions to keep conversations interesting\n"
-                    "- Admit when you don't know something instead of guessing\n"
-                    "- Give realistic, balanced answers—not always the 'perfect' response\n"
-                    "- Be concise but not robotic; write like a real person\n"
-                    "- Match the user's tone and energy when appropriate\n"
-                    "- Use context from the conversation to give better replies\n\n"
-                    "Keep responses focused and under 400 words when possible. "
-                    "If responding to questions, be thorough but readable."
-                ),
-            }
-        ]
-
-        # Add relevant history (last 6 exchanges = 12 messages)
-        # This gives context without overwhelming the model
-        for user_msg, bot_resp in history[-6:]:
-            if user_msg and bot_resp:
-                messages.append({"role": "user", "content": user_msg})
-                messages.append({"role": "assistant", "content": bot_resp})
+        messages = [SYSTEM_MESSAGE]
+
+        # Add relevant history (capped at the last 6 exchanges = 12 messages)
+        # Walk newest to oldest and stop once the character budget is spent,
+        # so a few huge messages don't bloat every later prompt
+        turns = []
+        budget = HISTORY_CHAR_BUDGET - len(user_input)
+        for user_msg, bot_resp in reversed(history):
+            if not user_msg or not bot_resp:
+                continue
+            budget -= len(user_msg) + len(bot_resp)
+            if budget < 0:
+                break
+            turns.append((user_msg, bot_resp))
+
+        for user_msg, bot_resp in reversed(turns):
+            messages.append({"role": "user", "content": user_msg})
+            messages.append({"role": "assistant", "content": bot_resp})
 
         # Add current user message
         messages.append({"role": "user", "content": user_input})
 
         return messages
 
-    async def _call_api(self, messages: list[dict]) -> Optional[str]:
+    async def _stream_api(self, messages: list[dict]) -> AsyncIterator[str]:
         """
-        Make the API call to Cloudflare Workers AI.
+        Make a streaming API call to Cloudflare Workers AI.
+
+        Retries only happen before any text has been received; a failure
+        mid-stream is raised to the caller.
 
         Args:
             messages: Message list for the API
 
-        Returns:
-            Generated response text or None if error
+        Yields:
+            The response text accumulated so far
         """
-        headers = {"Authorization": f"Bearer {self.api_key}"}
-        data = {"messages": messages}
-
+        body = json_dumps({"messages": messages, "stream": True})
         logger.debug(f"Sending API request with {len(messages)} messages")
 
-        async with aiohttp.ClientSession() as session:
-            for attempt in range(3):
-                try:
-                    async with session.post(
-                        f"{self.api_base}{self.model}",
-                        headers=headers,
-                        json=data,
-                        timeout=aiohttp.ClientTimeout(total=30),
-                    ) as response:
-                        if response.status == 200:
-                            json_data = await response.json()
-
-                            if not json_data.get("success"):
-                                error_msg = json_data.get("errors", [{}])[0].get(
-                                    "message", "Unknown error"
-                                )
-                                logger.warning(f"⚠️ API returned error: {error_msg}")
-                                return None
-
-                            response_text = (
-                                json_data.get("result", {}).get("response", "").strip()
-                            )
+        queue: asyncio.Queue[Optional[str]] = asyncio.Queue()
+        reader = asyncio.create_task(self._read_stream(body, queue))
+        text = ""
+        try:
+            while True:
+                # Take everything buffered since the last yield, so a slow
+                # consumer skips straight to the latest text
+                chunks = [await queue.get()]
+                while not queue.empty():
+                    chunks.append(queue.get_nowait())
+
+                new_text = "".join(chunk for chunk in chunks if chunk)
+                if new_text:
+                    text += new_text
+                    if text.strip():
+                        yield text.strip()
+
+                if chunks[-1] is None:
+                    break
+
+            # Surface a mid-stream failure from the reader
+            await reader
+        finally:
+            reader.cancel()
+
+    async def _read_stream(self, body: bytes, queue: asyncio.Queue) -> None:
+        """
+        Send a chat request and put each text delta on the queue, then None.
 
-                            if not response_text:
-                                logger.warning("⚠️ Empty response from API")
-                                return None
+        A concurrency slot is held while the request is open and its body is
+        read, and released while backing off between attempts. The queue is
+        unbounded so a slow consumer never holds up the read.
 
-                            return response_text
+        Args:
+            body: Encoded request body
+            queue: Queue receiving text deltas and a final None
 
-                        elif response.status == 429:
-                            logger.warning(f"Rate limited (attempt {attempt + 1}/3)")
-                            if attempt < 2:
-                                await asyncio.sleep(2**attempt)  # Exponential backoff
-                            continue
+        Raises:
+            asyncio.TimeoutError, aiohttp.ClientError: If the stream fails
+                after text has been queued
+        """
+        streamed = False
+        try:
+            for attempt in range(3):
+                try:
+                    async with self._api_sem:
+                        async with self._session.post(
+                            f"{self.api_base}{self.model}",
+                            data=body,
+                            headers=JSON_HEADERS,
+                        ) as response:
+                            if response.status == 200:
+                                # Server-sent events: `data: {"response": "..."}`
+                                async for line in response.content:
+                                    line = line.strip()
+                                    if not line.startswith(b"data:"):
+                                        continue
+                                    payload = line[5:].strip()
+                                    if payload == b"[DONE]":
+                                        break
+                                    delta = json_loads(payload).get("response", "")
+                                    if delta:
+                                        streamed = streamed or bool(delta.strip())
+                                        queue.put_nowait(delta)
+
+                                if not streamed:
+                                    logger.warning("⚠️ Empty response from API")
+                                return
+
+                            elif response.status not in RETRYABLE_STATUSES:
+                                error_text = await response.text()
+                                logger.error(
+                                    f"API error {response.status}: {error_text[:200]}"
+                                )
+                                return
 
-                        else:
-                            error_text = await response.text()
-                            logger.error(
-                                f"API error {response.status}: {error_text[:200]}"
+                            logger.warning(
+                                f"API returned {response.status} "
+                                f"(attempt {attempt + 1}/3)"
                             )
-                            return None
+                    # Exponential backoff with jitter, outside the slot
+                    delay = 2**attempt + random.random() * 0.2
 
                 except asyncio.TimeoutError:
+                    if streamed:
+                        raise
                     logger.warning(f"Request timeout (attempt {attempt + 1}/3)")
-                    if attempt < 2:
-                        await asyncio.sleep(1)
-                    continue
+                    delay = 1
 
                 except aiohttp.ClientError as e:
+                    if streamed:
+                        raise
                     logger.error(f"Network error: {e}")
-                    return None
+                    return
+
+                if attempt < 2:
+                    await asyncio.sleep(delay)
 
-        logger.error("Failed to get API response after 3 attempts")
-        return None
+            logger.error("Failed to get API response after 3 attempts")
+        finally:
+            queue.put_nowait(None)
 
 
 async def setup(bot: commands.Bot):
@@ -1,3 +1,4 @@
+import asyncio
 import os
 from typing import Literal, Optional
 
@@ -9,13 +10,121 @@ from logger import setup_logger
 from utils.checks import is_owner_or_mod_check
 
 DEV_GUILD_ID = int(os.getenv("DEV_GUILD_ID"))
+SUCCESS_COLOR = 0xBEBEFE
+ERROR_COLOR = 0xE02B2B
+# Leaves headroom under Discord's 4096 character embed description limit
+FAILURE_SUMMARY_LIMIT = 3900
 
 logger = setup_logger("CogManager")
 
 
+def _walk_cogs() -> tuple[list[str], list[str]]:
+    """
+    Walk cogs/ for cog modules.
+
+    Returns:
+        The directories visited and the dotted module names found
+    """
+    dirs = []
+    modules = []
+    pending = [("cogs", "cogs")]
+    while pending:
+        path, package = pending.pop()
+        dirs.append(path)
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir():
+                    # __pycache__ holds no cogs and its mtime changes on import
+                    if name != "__pycache__":
+                        pending.append((entry.path, f"{package}.{name}"))
+                elif name.endswith(".py") and not name.startswith("_"):
+                    modules.append(f"{package}.{name[:-3]}")
+    return dirs, modules
+
+
+def _latest_mtime(dirs: list[str]) -> float:
+    """Return the newest mtime among dirs, or -1 if any of them is gone."""
+    try:
+        return max(os.stat(path).st_mtime for path in dirs)
+    except (FileNotFoundError, ValueError):
+        return -1.0
+
+
+def _failure_summary(failed_cogs: list[str]) -> str:
+    """
+    Join reload failures into an embed description. Failures that don't fit
+    in FAILURE_SUMMARY_LIMIT are left out and counted instead.
+    """
+    shown = []
+    length = 0
+    for failure in failed_cogs:
+        room = FAILURE_SUMMARY_LIMIT - length
+        if len(failure) > room:
+            if shown:
+                break
+            # A single failure longer than the limit is cut short
+            failure = failure[: room - 1] + "…"
+        shown.append(failure)
+        length += len(failure) + 1
+
+    hidden = len(failed_cogs) - len(shown)
+    if hidden:
+        shown.append(f"…and {hidden} more (see logs)")
+    return "\n".join(shown)
+
+
 class CogManager(commands.Cog):
     def __init__(self, bot) -> None:
         self.bot = bot
+        # (directories, newest directory mtime, cog module names) from the
+        # last walk of cogs/; cleared by load/unload/reload
+        self._cog_cache: Optional[tuple[list[str], float, list[str]]] = None
+
+    async def _discover_cogs(self) -> list[str]:
+        """
+        Return the dotted module names of every cog file.
+
+        The last walk is reused while no directory under cogs/ has changed;
+        otherwise cogs/ is walked again in a worker thread.
+        """
+        if self._cog_cache is not None:
+            dirs, mtime, modules = self._cog_cache
+            if _latest_mtime(dirs) == mtime:
+                return modules
+
+        dirs, modules = await asyncio.to_thread(_walk_cogs)
+        self._cog_cache = (dirs, _latest_mtime(dirs), modules)
+        return modules
+
+    async def _cogs_to_reload(self) -> list[str]:
+        """Return every loaded extension, followed by cog files not yet loaded."""
+        loaded = self.bot.extensions
+        discovered = await self._discover_cogs()
+        return list(loaded) + [name for name in discovered if name not in loaded]
+
+    async def _reload_one(self, name: str) -> tuple[str, bool, Optional[Exception]]:
+        """
+        Reload an extension, loading it instead if it isn't loaded yet.
+
+        Args:
+            name: Dotted extension name
+
+        Returns:
+            The name, whether it was reloaded (False if newly loaded), and the
+            exception raised, if any
+        """
+        try:
+            await self.bot.reload_extension(name)
+            return name, True, None
+        except ExtensionNotLoaded:
+            try:
+                await self.bot.load_extension(name)
+                return name, False, None
+            except Exception as e:
+                return name, False, e
+        except Exception as e:
+            return name, True, e
 
     @app_commands.command(
         name="load",
@@ -31,18 +140,20 @@ class CogManager(commands.Cog):
         :param interaction: The hybrid command interaction.
         :param cog: The name of the cog to load.
         """
+        self._cog_cache = None
+        await interaction.response.defer(ephemeral=True)
         try:
             await self.bot.load_extension(f"cogs.{cog}")
         except Exception:
             embed = discord.Embed(
-                description=f"Could not load the `{cog}` cog.", color=0xE02B2B
+                description=f"Could not load the `{cog}` cog.", color=ERROR_COLOR
             )
-            await interaction.response.send_message(embed=embed)
+            await interaction.followup.send(embed=embed, ephemeral=True)
             return
         embed = discord.Embed(
-            description=f"Successfully loaded the `{cog}` cog.", color=0xBEBEFE
+            description=f"Successfully loaded the `{cog}` cog.", color=SUCCESS_COLOR
         )
-        await interaction.response.send_message(embed=embed)
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     @app_commands.command(
         name="unload",
@@ -58,18 +169,20 @@ class CogManager(commands.Cog):
         :param interaction: The hybrid command interaction.
         :param cog: The name of the cog to unload.
         """
+        self._cog_cache = None
+        await interaction.response.defer(ephemeral=True)
         try:
             await self.bot.unload_extension(f"cogs.{cog}")
         except Exception:
             embed = discord.Embed(
-                description=f"Could not unload the `{cog}` cog.", color=0xE02B2B
+                description=f"Could not unload the `{cog}` cog.", color=ERROR_COLOR
             )
-            await interaction.response.send_message(embed=embed)
+            await interaction.followup.send(embed=embed, ephemeral=True)
             return
         embed = discord.Embed(
-            description=f"Successfully unloaded the `{cog}` cog.", color=0xBEBEFE
+            description=f"Successfully unloaded the `{cog}` cog.", color=SUCCESS_COLOR
         )
-        await interaction.response.send_message(embed=embed)
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     @app_commands.command(name="reload", description="Reloads a cog or all cogs.")
     @app_commands.describe(cog="The name of the cog to reload")
@@ -86,6 +199,7 @@ class CogManager(commands.Cog):
         try:
             if cog:
                 # Reload or load the specific cog
+                self._cog_cache = None
                 cog_path = f"cogs.{cog}"
                 try:
                     await self.bot.reload_extension(cog_path)
@@ -95,53 +209,46 @@ class CogManager(commands.Cog):
                     result = (
                         f"✅ Cog `{cog}` was not loaded, so it has now been loaded."
                     )
-                embed = discord.Embed(description=result, color=0xBEBEFE)
+                embed = discord.Embed(description=result, color=SUCCESS_COLOR)
             else:
                 # Reload or load all cogs
-                cogs_to_reload = [
-                    os.path.splitext(os.path.join(root, file))[0].replace(os.sep, ".")
-                    for root, _, files in os.walk("cogs")
-                    for file in files
-                    if file.endswith(".py") and not file.startswith("_")
-                ]
+                cogs_to_reload = await self._cogs_to_reload()
+
+                results = await asyncio.gather(
+                    *(self._reload_one(name) for name in cogs_to_reload)
+                )
 
                 failed_cogs = []
                 logged_folders = set()
 
-                for name in cogs_to_reload:
+                for name, _, error in results:
+                    if error is not None:
+                        failed_cogs.append(f"`{name}`: {error}")
+                        logger.error("Failed to reload or load %s cog: %s", name, error)
+                        continue
+
                     parts = name.split(".")
                     top_level_name = ".".join(parts[:2]) if len(parts) >= 2 else name
-
-                    try:
-                        try:
-                            await self.bot.reload_extension(name)
-                        except ExtensionNotLoaded:
-                            await self.bot.load_extension(name)
-
-                        if top_level_name not in logged_folders:
-                            logger.info(f"Reloaded {top_level_name} cog.")
-                            logged_folders.add(top_level_name)
-
-                    except Exception as e:
-                        failed_cogs.append(f"`{name}`: {e}")
-                        logger.error(f"Failed to reload or load {name} cog: {e}")
+                    if top_level_name not in logged_folders:
+                        logger.info("Reloaded %s cog.", top_level_name)
+                        logged_folders.add(top_level_name)
 
                 if failed_cogs:
                     embed = discord.Embed(
                         title="⚠️ Some cogs failed to reload or load:",
-                        description="\n".join(failed_cogs),
-                        color=0xE02B2B,
+                        description=_failure_summary(failed_cogs),
+                        color=ERROR_COLOR,
                     )
                 else:
                     embed = discord.Embed(
                         description="✅ Successfully reloaded or loaded all cogs!",
-                        color=0xBEBEFE,
+                        color=SUCCESS_COLOR,
                     )
 
         except Exception as e:
             embed = discord.Embed(
                 description=f"❌ An error occurred while reloading.\n```{e}```",
-                color=0xE02B2B,
+                color=ERROR_COLOR,
             )
 
         await interaction.followup.send(embed=embed, ephemeral=True)
@@ -161,6 +268,7 @@ class CogManager(commands.Cog):
         try:
             if cog:
                 # Reload or load the specific cog
+                self._cog_cache = None
                 cog_path = f"cogs.{cog}"
                 try:
                     await self.bot.reload_extension(cog_path)
@@ -170,45 +278,42 @@ class CogManager(commands.Cog):
                     result = (
                         f"✅ Cog `{cog}` was not loaded, so it has now been loaded."
                     )
-                embed = discord.Embed(description=result, color=0xBEBEFE)
+                embed = discord.Embed(description=result, color=SUCCESS_COLOR)
             else:
                 # Reload or load all cogs
-                cogs_to_reload = [
-                    os.path.splitext(os.path.join(root, file))[0].replace(os.sep, ".")
-                    for root, _, files in os.walk("cogs")
-                    for file in files
-                    if file.endswith(".py") and not file.startswith("_")
-                ]
+                cogs_to_reload = await self._cogs_to_reload()
+
+                results = await asyncio.gather(
+                    *(self._reload_one(name) for name in cogs_to_reload)
+                )
 
                 failed_cogs = []
 
-                for name in cogs_to_reload:
-                    try:
-                        try:
-                            await self.bot.reload_extension(name)
-                            logger.info(f"Reloaded {name} cog.")
-                        except ExtensionNotLoaded:
-                            await self.bot.load_extension(name)
-                            logger.info(f"Loaded new cog: {name}")
-                    except Exception as e:
-                        failed_cogs.append(f"`{name}`: {e}")
+                for name, reloaded, error in results:
+                    if error is not None:
+                        failed_cogs.append(f"`{name}`: {error}")
+                        logger.error("Failed to reload or load %s cog: %s", name, error)
+                    elif reloaded:
+                        logger.info("Reloaded %s cog.", name)
+                    else:
+                        logger.info("Loaded new cog: %s", name)
 
                 if failed_cogs:
                     embed = discord.Embed(
                         title="⚠️ Some cogs failed to reload or load:",
-                        description="\n".join(failed_cogs),
-                        color=0xE02B2B,
+                        description=_failure_summary(failed_cogs),
+                        color=ERROR_COLOR,
                     )
                 else:
                     embed = discord.Embed(
                         description="✅ Successfully reloaded or loaded all cogs!",
-                        color=0xBEBEFE,
+                        color=SUCCESS_COLOR,
                     )
 
         except Exception as e:
             embed = discord.Embed(
                 description=f"❌ An error occurred while reloading.\n```{e}```",
-                color=0xE02B2B,
+                color=ERROR_COLOR,
             )
 
         await interaction.followup.send(embed=embed, ephemeral=True)
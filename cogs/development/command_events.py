@@ -1,4 +1,4 @@
-from datetime import datetime
+import logging
 
 import discord
 from discord import app_commands
@@ -10,11 +10,48 @@ from logger import setup_logger
 
 logger = setup_logger("CommandEvents")
 
+# User-facing errors that need a reply but no traceback or error log
+EXPECTED_ERRORS = (
+    CheckFailure,
+    CommandOnCooldown,
+    MissingPermissions,
+    BotMissingPermissions,
+)
+
+GREEN = "\x1b[32m"
+RED = "\x1b[31m"
+RESET = "\x1b[0m"
+
+NO_PERMISSION_MESSAGE = "You do not have permission to use this command."
+BOT_NO_PERMISSION_MESSAGE = "I do not have permission to execute this command."
+COOLDOWN_MESSAGE = "This command is on cooldown. Try again in %.2f seconds."
+
+# Replies for errors with fixed messages, most specific types first
+ERROR_MESSAGES = {
+    MissingPermissions: NO_PERMISSION_MESSAGE,
+    BotMissingPermissions: BOT_NO_PERMISSION_MESSAGE,
+    CheckFailure: NO_PERMISSION_MESSAGE,
+}
+
+# Log templates, filled in lazily by the logger (which adds the timestamp)
+COMPLETION_LOG = GREEN + "[%s][#%s] %s: %s Successfully executed." + RESET
+DM_COMPLETION_LOG = GREEN + "[DMs] %s: %s Successfully executed." + RESET
+ERROR_LOG = RED + "[%s][#%s] %s: ERROR in %s — %s%s" + RESET
+DM_ERROR_LOG = RED + "[DMs] %s: ERROR in %s — %s%s" + RESET
+
 
 class CommandEvents(commands.Cog):
     def __init__(self, bot) -> None:
         self.bot = bot
-        bot.tree.on_error = self.on_app_command_error
+        self._previous_on_error = None
+
+    async def cog_load(self) -> None:
+        # Route tree errors here, remembering the handler to restore on unload
+        self._previous_on_error = self.bot.tree.on_error
+        self.bot.tree.on_error = self.on_app_command_error
+
+    async def cog_unload(self) -> None:
+        self.bot.tree.on_error = self._previous_on_error
 
     @commands.Cog.listener()
     async def on_app_command_completion(
@@ -23,25 +60,25 @@ class CommandEvents(commands.Cog):
         """
         This event is triggered when a slash command has been successfully executed.
         """
+        # Nothing to do when INFO records would be dropped anyway
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
         executed_command = f"/{command.qualified_name}"
         user = interaction.user
-        now = datetime.now().strftime("%I:%M:%S:%p")  # 12-hour format
-
-        GREEN = "\x1b[32m"
-        RESET = "\x1b[0m"
-
-        if interaction.guild:
-            guild_name = interaction.guild.name
-            channel_name = (
-                interaction.channel.name
-                if isinstance(interaction.channel, discord.TextChannel)
-                else "Unknown"
+        guild = interaction.guild
+
+        if guild:
+            channel_name = getattr(interaction.channel, "name", "Unknown")
+            logger.info(
+                COMPLETION_LOG,
+                guild.name,
+                channel_name,
+                user,
+                executed_command,
             )
-            log_msg = f"{GREEN}[{guild_name}][#{channel_name}][{now}] {user}: {executed_command} Successfully executed.{RESET}"
         else:
-            log_msg = f"{GREEN}[DMs][{now}] {user}: {executed_command} Successfully executed.{RESET}"
-
-        logger.info(log_msg)
+            logger.info(DM_COMPLETION_LOG, user, executed_command)
 
     @commands.Cog.listener()
     async def on_app_command_error(
@@ -50,55 +87,71 @@ class CommandEvents(commands.Cog):
         """
         This event is triggered when an error occurs while executing a slash command.
         """
-        command_name = (
-            f"/{interaction.command.name}" if interaction.command else "/unknown"
-        )
+        command = interaction.command
+        command_name = f"/{command.name}" if command else "/unknown"
         user = interaction.user
-        now = datetime.now().strftime("%I:%M:%S:%p")  # 12-hour format
 
-        RED = "\x1b[31m"
-        RESET = "\x1b[0m"
-
-        if interaction.guild:
-            guild_name = interaction.guild.name
-            channel_name = (
-                interaction.channel.name
-                if isinstance(interaction.channel, discord.TextChannel)
-                else "Unknown"
+        if isinstance(error, EXPECTED_ERRORS):
+            logger.info("%s: %s rejected — %s", user, command_name, error)
+            await self._notify_user(interaction, error)
+            return
+
+        # Point at the innermost frame of the original exception
+        original = getattr(error, "original", error)
+        tb = original.__traceback__
+        if tb is not None:
+            while tb.tb_next is not None:
+                tb = tb.tb_next
+            origin = f" ({tb.tb_frame.f_code.co_filename}:{tb.tb_lineno})"
+        else:
+            origin = ""
+
+        guild = interaction.guild
+        if guild:
+            channel_name = getattr(interaction.channel, "name", "Unknown")
+            logger.error(
+                ERROR_LOG,
+                guild.name,
+                channel_name,
+                user,
+                command_name,
+                error,
+                origin,
+                exc_info=error,
             )
-            log_msg = f"{RED}[{guild_name}][#{channel_name}][{now}] {user}: ERROR in {command_name} — {error}{RESET}"
         else:
-            log_msg = (
-                f"{RED}[DMs][{now}] {user}: ERROR in {command_name} — {error}{RESET}"
+            logger.error(
+                DM_ERROR_LOG, user, command_name, error, origin, exc_info=error
             )
 
-        logger.error(log_msg, exc_info=True)
+        await self._notify_user(interaction, error)
 
+    async def _notify_user(
+        self, interaction: discord.Interaction, error: AppCommandError
+    ) -> None:
+        """
+        Tell the user why their command failed.
+        """
         # Respond to the user if possible
         if not interaction.response.is_done():
             await interaction.response.defer(ephemeral=True)
 
         if isinstance(error, CommandOnCooldown):
-            await interaction.followup.send(
-                f"This command is on cooldown. Try again in {error.retry_after:.2f} seconds.",
-                ephemeral=True,
-            )
-        elif isinstance(error, MissingPermissions):
-            await interaction.followup.send(
-                "You do not have permission to use this command.", ephemeral=True
-            )
-        elif isinstance(error, BotMissingPermissions):
-            await interaction.followup.send(
-                "I do not have permission to execute this command.", ephemeral=True
-            )
-        elif isinstance(error, CheckFailure):
-            await interaction.followup.send(
-                "You do not have permission to use this command.", ephemeral=True
-            )
+            message = COOLDOWN_MESSAGE % error.retry_after
         else:
-            await interaction.followup.send(
-                f"An error occurred: {error}", ephemeral=True
-            )
+            message = ERROR_MESSAGES.get(type(error))
+            if message is None:
+                # Subclasses of the mapped errors, e.g. custom check failures
+                message = next(
+                    (
+                        text
+                        for error_type, text in ERROR_MESSAGES.items()
+                        if isinstance(error, error_type)
+                    ),
+                    f"An error occurred: {error}",
+                )
+
+        await interaction.followup.send(message, ephemeral=True)
 
 
 async def setup(bot) -> None:
@@ -1,3 +1,5 @@
+from typing import Optional
+
 import discord
 from discord import app_commands
 from discord.ext import commands
@@ -7,17 +9,27 @@ class Invite(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
+        # The invite URL never changes for a running bot, so build it once
+        self._invite_url: Optional[str] = None
+
+    async def _get_invite_url(self) -> str:
+        if self._invite_url is None:
+            # application_id is set at login; only fall back to the API if not
+            client_id = self.bot.application_id
+            if client_id is None:
+                client_id = (await self.bot.application_info()).id
+            self._invite_url = discord.utils.oauth_url(
+                client_id=client_id,
+                permissions=discord.Permissions(
+                    administrator=True
+                ),  # Customize perms if needed
+                scopes=("bot", "applications.commands"),
+            )
+        return self._invite_url
 
     @app_commands.command(name="invite", description="Get the bot's invite link")
     async def invite(self, interaction: discord.Interaction):
-        app_info = await self.bot.application_info()
-        invite_url = discord.utils.oauth_url(
-            client_id=app_info.id,
-            permissions=discord.Permissions(
-                administrator=True
-            ),  # Customize perms if needed
-            scopes=("bot", "applications.commands"),
-        )
+        invite_url = await self._get_invite_url()
         embed = discord.Embed(
             title="Invite Me!",
             description=f"[Click here to invite the bot!]({invite_url})",
@@ -1,92 +1,159 @@
-import json
-from datetime import datetime, timezone
+import asyncio
+import logging
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, Sequence
 
 import discord
 from discord.ext import commands
 from logger import setup_logger
-from utils.channels import send_to_mod_log
+from utils.channels import queue_mod_log
+from utils.serialization import json_dumps
 
 logger = setup_logger("MessageLogger")
 
+# Pending DB writes before new ones are dropped, and rows written per batch
+WRITE_QUEUE_SIZE = 10000
+WRITE_BATCH_SIZE = 64
+
+# Shared empty value for messages without attachments or stickers
+NO_ITEMS = ()
+
 
 class MessageLogger(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.message_cache = {}
+        # LRU of recent messages with attachments/stickers, keyed by message ID
+        self.message_cache: OrderedDict[int, dict] = OrderedDict()
         self.cache_limit = 2000
+        # ("new" | "edit" | "delete", row) writes, drained by _drain_writes
+        self._write_queue: asyncio.Queue = asyncio.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._writer_task: Optional[asyncio.Task] = None
+
+    async def cog_load(self):
+        self._writer_task = asyncio.create_task(self._drain_writes())
+
+    async def cog_unload(self):
+        # Let the writer flush what is already queued, then stop. Cancelling
+        # it could interrupt a batch halfway through its transaction.
+        if self._writer_task:
+            await self._write_queue.put(None)
+            await self._writer_task
 
-    def cog_unload(self):
         self.message_cache.clear()
 
+    def _queue_write(self, kind: str, row: tuple) -> None:
+        """Queue a message log write without waiting on the database."""
+        try:
+            self._write_queue.put_nowait((kind, row))
+        except asyncio.QueueFull:
+            logger.warning("Message log write queue full, dropping %s write", kind)
+
+    async def _drain_writes(self):
+        """Write queued message logs in batches until a None sentinel arrives."""
+        while True:
+            item = await self._write_queue.get()
+            if item is None:
+                return
+            batch = [item]
+            stop = False
+            while len(batch) < WRITE_BATCH_SIZE:
+                try:
+                    item = self._write_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            await self._write_batch(batch)
+            if stop:
+                return
+
+    async def _write_batch(self, batch: list[tuple[str, tuple]]):
+        rows = {"new": [], "edit": [], "delete": []}
+        for kind, row in batch:
+            rows[kind].append(row)
+
+        try:
+            await self.bot.database.message_db.log_message_batch(
+                rows["new"], rows["edit"], rows["delete"]
+            )
+        except Exception as e:
+            logger.error("Failed to write %d message logs to DB: %s", len(batch), e)
+
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
         if message.author.bot or not message.guild:
             return
 
-        timestamp = datetime.now().strftime("%I:%M:%S:%p")
-
-        if message.guild:
-            guild_name = message.guild.name
-            channel_name = f"#{message.channel.name}"
-            prefix = f"[{guild_name}][{channel_name}]"
-        else:
-            author_tag = f"{message.author.name}#{message.author.discriminator}"
-            prefix = f"[DM][{author_tag}]"
+        urls = [a.url for a in message.attachments] if message.attachments else NO_ITEMS
+        sticker_names = (
+            [sticker.name for sticker in message.stickers]
+            if message.stickers
+            else NO_ITEMS
+        )
 
-        user_display = message.author.display_name
+        # Skip building the log line entirely when INFO is disabled
+        if logger.isEnabledFor(logging.INFO):
+            # Same output as strftime("%I:%M:%S:%p") without the locale lookup
+            now = datetime.now()
+            hour = now.hour % 12 or 12
+            meridiem = "AM" if now.hour < 12 else "PM"
+            timestamp = f"{hour:02d}:{now.minute:02d}:{now.second:02d}:{meridiem}"
 
-        if message.content.strip():
-            content_to_log = message.content
-        else:
-            parts = []
-            # Add attachments URLs if any
-            if message.attachments:
-                parts.extend(a.url for a in message.attachments)
-            # Add sticker names if any
-            if message.stickers:
-                parts.extend(
-                    f"[Sticker: {sticker.name}]" for sticker in message.stickers
-                )
+            prefix = f"[{message.guild.name}][#{message.channel.name}]"
 
-            content_to_log = " ".join(parts)
+            user_display = message.author.display_name
 
-        log_line = f"{prefix}[{timestamp}] {user_display}: {content_to_log}"
+            if message.content.strip():
+                content_to_log = message.content
+            else:
+                # Attachment URLs and sticker names stand in for the text
+                parts = [*urls, *(f"[Sticker: {name}]" for name in sticker_names)]
+                content_to_log = " ".join(parts)
 
-        logger.info(log_line)
+            logger.info(
+                "%s[%s] %s: %s", prefix, timestamp, user_display, content_to_log
+            )
 
-        if not message.attachments and not message.stickers:
+        # Keep messages with attachments, or stickers alongside text; a bare
+        # sticker would only store empty content and "[]"
+        if not urls and not (sticker_names and message.content.strip()):
             return
 
         self.message_cache[message.id] = {
             "content": message.content,
             "author_id": message.author.id,
-            "attachments": [a.url for a in message.attachments],
-            "stickers": [sticker.name for sticker in message.stickers],
+            "attachments": urls,
+            "stickers": sticker_names,
             "channel_id": message.channel.id,
         }
 
         if len(self.message_cache) > self.cache_limit:
-            self.message_cache.pop(next(iter(self.message_cache)))
+            self.message_cache.popitem(last=False)
 
-        await self.save_message_to_db(message)
+        self.save_message_to_db(message, urls)
 
-    async def save_message_to_db(self, message: discord.Message):
-        try:
-            await self.bot.database.message_db.log_new_message(
+    def save_message_to_db(self, message: discord.Message, urls: Sequence[str]):
+        self._queue_write(
+            "new",
+            (
                 message.id,
                 message.guild.id,
                 message.channel.id,
                 message.author.id,
                 message.content,
-                json.dumps([a.url for a in message.attachments]),
+                json_dumps(urls).decode(),
                 message.created_at.replace(tzinfo=None).isoformat(),
-            )
-        except Exception as e:
-            logger.error(f"Failed to save message {message.id} to DB: {e}")
+            ),
+        )
 
     @commands.Cog.listener()
     async def on_message_edit(self, before: discord.Message, after: discord.Message):
-        if before.author.bot or not before.guild or before.content == after.content:
+        # Link preview (embed-only) updates are the most common edit event and
+        # leave the content alone, so test that first
+        if before.content == after.content or before.author.bot or not before.guild:
             return
 
         embed = discord.Embed(
@@ -96,23 +163,19 @@ class MessageLogger(commands.Cog):
                 f"**After:**\n{after.content or '*No content*'}"
             ),
             color=discord.Color.orange(),
-            timestamp=datetime.now(timezone.utc),
+            timestamp=discord.utils.utcnow(),
         )
         embed.set_author(
             name=str(before.author), icon_url=before.author.display_avatar.url
         )
 
-        await send_to_mod_log(self.bot, before.guild, embed)
+        queue_mod_log(self.bot, before.guild, embed)
 
         if after.id in self.message_cache:
             self.message_cache[after.id]["content"] = after.content
+            self.message_cache.move_to_end(after.id)
 
-        try:
-            await self.bot.database.message_db.update_message_content(
-                after.id, after.content
-            )
-        except Exception as e:
-            logger.error(f"Failed to update message {after.id}: {e}")
+        self._queue_write("edit", (after.content, after.id))
 
     @commands.Cog.listener()
     async def on_message_delete(self, message: discord.Message):
@@ -120,32 +183,34 @@ class MessageLogger(commands.Cog):
             return
 
         cached = self.message_cache.get(message.id)
-        attachments = cached["attachments"] if cached else []
+        attachments = cached["attachments"] if cached else NO_ITEMS
         content = cached["content"] if cached else message.content or "*No content*"
 
+        lines = [
+            f"🗑️ Message deleted in {message.channel.mention} by {message.author.mention}",
+            "",
+            "**Content:**",
+            content,
+            "",
+        ]
+        lines.extend(
+            f"**Attachment {i}:** {url}" for i, url in enumerate(attachments, 1)
+        )
+
         embed = discord.Embed(
-            description=(
-                f"🗑️ Message deleted in {message.channel.mention} by {message.author.mention}\n\n"
-                f"**Content:**\n{content}\n\n"
-                + "\n".join(
-                    f"**Attachment {i+1}:** {url}" for i, url in enumerate(attachments)
-                )
-            ),
+            description="\n".join(lines),
             color=discord.Color.red(),
-            timestamp=datetime.now(timezone.utc),
+            timestamp=discord.utils.utcnow(),
         )
         embed.set_author(
             name=str(message.author), icon_url=message.author.display_avatar.url
         )
 
-        await send_to_mod_log(self.bot, message.guild, embed)
+        queue_mod_log(self.bot, message.guild, embed)
 
-        try:
-            await self.bot.database.message_db.mark_message_deleted(
-                message.id, datetime.utcnow().isoformat()
-            )
-        except Exception as e:
-            logger.error(f"Failed to mark message deleted: {e}")
+        # Naive UTC ISO string, matching how created_at is stored
+        deleted_at = discord.utils.utcnow().replace(tzinfo=None).isoformat()
+        self._queue_write("delete", (deleted_at, message.id))
 
         self.message_cache.pop(message.id, None)
 
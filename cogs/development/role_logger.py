@@ -1,8 +1,11 @@
-from datetime import datetime, timezone
+from operator import attrgetter
 
 import discord
 from discord.ext import commands
-from utils.channels import send_to_mod_log
+from utils.channels import queue_mod_log
+
+# The role attributes worth logging; position-only updates are ignored
+ROLE_LOGGED_FIELDS = attrgetter("name", "color", "permissions", "mentionable", "hoist")
 
 
 class RoleLogger(commands.Cog):
@@ -15,9 +18,9 @@ class RoleLogger(commands.Cog):
             title="➕ Role Created",
             description=f"Role **{role.name}** (`{role.id}`) was created.",
             color=discord.Color.green(),
-            timestamp=datetime.now(timezone.utc),
+            timestamp=discord.utils.utcnow(),
         )
-        await send_to_mod_log(self.bot, role.guild, embed)
+        queue_mod_log(self.bot, role.guild, embed)
 
     @commands.Cog.listener()
     async def on_guild_role_delete(self, role: discord.Role):
@@ -25,12 +28,16 @@ class RoleLogger(commands.Cog):
             title="➖ Role Deleted",
             description=f"Role **{role.name}** (`{role.id}`) was deleted.",
             color=discord.Color.red(),
-            timestamp=datetime.now(timezone.utc),
+            timestamp=discord.utils.utcnow(),
         )
-        await send_to_mod_log(self.bot, role.guild, embed)
+        queue_mod_log(self.bot, role.guild, embed)
 
     @commands.Cog.listener()
     async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        # Reordering roles fires an update per role; bail before diffing
+        if ROLE_LOGGED_FIELDS(before) == ROLE_LOGGED_FIELDS(after):
+            return
+
         changes = []
 
         if before.name != after.name:
@@ -48,17 +55,14 @@ class RoleLogger(commands.Cog):
                 f"**Displayed Separately:** `{before.hoist}` → `{after.hoist}`"
             )
 
-        if not changes:
-            return  # Nothing meaningful changed
-
         embed = discord.Embed(
             title="✏️ Role Updated",
             description=f"Role **{after.name}** (`{after.id}`) was updated.",
             color=discord.Color.orange(),
-            timestamp=datetime.now(timezone.utc),
+            timestamp=discord.utils.utcnow(),
         )
         embed.add_field(name="Changes", value="\n".join(changes), inline=False)
-        await send_to_mod_log(self.bot, after.guild, embed)
+        queue_mod_log(self.bot, after.guild, embed)
 
 
 async def setup(bot):
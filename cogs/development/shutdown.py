@@ -7,6 +7,8 @@ from utils.checks import is_owner_or_mod_check
 
 DEV_GUILD_ID = int(os.getenv("DEV_GUILD_ID"))
 
+SHUTDOWN_EMBED = discord.Embed(description="Shutting down. Bye! :wave:", color=0xBEBEFE)
+
 
 class Development(commands.Cog):
     def __init__(self, bot) -> None:
@@ -24,8 +26,7 @@ class Development(commands.Cog):
 
         :param interaction: The hybrid command interaction.
         """
-        embed = discord.Embed(description="Shutting down. Bye! :wave:", color=0xBEBEFE)
-        await interaction.response.send_message(embed=embed)
+        await interaction.response.send_message(embed=SHUTDOWN_EMBED)
         await self.bot.close()
 
 
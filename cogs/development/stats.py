@@ -1,17 +1,67 @@
-import os
 import platform
+import time
 from datetime import datetime
+from typing import Optional
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 from utils.checks import is_owner_or_mod_check
 
+# Fixed for the life of the process
+PYTHON_VERSION = platform.python_version()
+DISCORD_PY_VERSION = discord.__version__.split()[0]
+
+# Seconds to reuse the guild and slash command counts between /bot-stats calls
+STATS_CACHE_TTL = 30
+
 
 class BotStats(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
+        # Running member total across guilds, summed once on the first
+        # /bot-stats and then kept current by the listeners below
+        self._member_total: Optional[int] = None
+        # (monotonic timestamp, guild count, slash command count), refreshed
+        # once older than STATS_CACHE_TTL
+        self._counts_cache: Optional[tuple[float, int, int]] = None
+
+    def _cached_counts(self) -> tuple[int, int]:
+        """
+        Return the guild and slash command counts.
+
+        Both bot.guilds and tree.get_commands() build a fresh list, so the
+        counts are reused for STATS_CACHE_TTL seconds.
+        """
+        now = time.monotonic()
+        if self._counts_cache is None or now - self._counts_cache[0] >= STATS_CACHE_TTL:
+            self._counts_cache = (
+                now,
+                len(self.bot.guilds),
+                len(self.bot.tree.get_commands()),
+            )
+        return self._counts_cache[1], self._counts_cache[2]
+
+    def _adjust_member_total(self, delta: int) -> None:
+        if self._member_total is not None:
+            self._member_total += delta
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild):
+        self._adjust_member_total(guild.member_count or 0)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self._adjust_member_total(-(guild.member_count or 0))
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        self._adjust_member_total(1)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        self._adjust_member_total(-1)
 
     @app_commands.command(name="bot-stats", description="Show stats of the bot.")
     @app_commands.check(is_owner_or_mod_check)
@@ -20,33 +70,18 @@ class BotStats(commands.Cog):
         Provides statistics about the bot, including latency, uptime, and more.
         """
         # Gather stats
-        guild_count = len(self.bot.guilds)
-        user_count = sum(guild.member_count or 0 for guild in self.bot.guilds)
-
-        # Safely get cog count (handle missing or empty directory)
-        cog_count = 0
-        try:
-            cog_count = len(
-                [
-                    filename
-                    for filename in os.listdir("cogs/")
-                    if filename.endswith(".py")
-                ]
+        guild_count, slash_command_count = self._cached_counts()
+        if self._member_total is None:
+            self._member_total = sum(
+                guild.member_count or 0 for guild in self.bot.guilds
             )
-        except FileNotFoundError:
-            cog_count = 0
+        user_count = self._member_total
 
-        slash_command_count = len(self.bot.tree.get_commands())
+        # Loaded extensions are tracked in memory, no directory scan needed
+        cog_count = len(self.bot.extensions)
 
-        # Uptime calculation
-        uptime = datetime.now() - self.bot.start_time
-        total_seconds = int(uptime.total_seconds())
-        days, remainder = divmod(total_seconds, 86400)
-        hours, remainder = divmod(remainder, 3600)
-        minutes, seconds = divmod(remainder, 60)
-
-        # Formatted uptime with pluralization
-        duration_formatted = f"{days} {'Day' if days == 1 else 'Days'}:{hours} {'Hour' if hours == 1 else 'Hours'}:{minutes} {'Minute' if minutes == 1 else 'Minutes'}:{seconds} {'Second' if seconds == 1 else 'Seconds'}"
+        # Relative timestamp, rendered by the client ("3 days ago")
+        uptime = discord.utils.format_dt(self.bot.start_time, style="R")
 
         # Creating the embed message
         embed = discord.Embed(
@@ -63,25 +98,19 @@ class BotStats(commands.Cog):
         )
         embed.set_thumbnail(url=avatar_url)
 
-        # Add fields to the embed
-        embed.add_field(
-            name="Ping", value=f"{round(self.bot.latency * 1000)}ms", inline=True
-        )
-        embed.add_field(name="Total Servers", value=str(guild_count), inline=True)
-        embed.add_field(name="Total Members", value=str(user_count), inline=True)
-        embed.add_field(name="Uptime", value=duration_formatted, inline=True)
-        embed.add_field(
-            name="Discord.py Version",
-            value=f"{discord.__version__.split()[0]}",
-            inline=True,
-        )
-        embed.add_field(
-            name="Python Version", value=platform.python_version(), inline=True
-        )
-        embed.add_field(name="Total Cogs", value=str(cog_count), inline=True)
-        embed.add_field(
-            name="Total Slash Commands", value=str(slash_command_count), inline=True
+        # Add fields to the embed (all inline)
+        fields = (
+            ("Ping", f"{round(self.bot.latency * 1000)}ms"),
+            ("Total Servers", guild_count),
+            ("Total Members", user_count),
+            ("Uptime", uptime),
+            ("Discord.py Version", DISCORD_PY_VERSION),
+            ("Python Version", PYTHON_VERSION),
+            ("Total Cogs", cog_count),
+            ("Total Slash Commands", slash_command_count),
         )
+        for name, value in fields:
+            embed.add_field(name=name, value=value, inline=True)
 
         # Send the embed message
         await interaction.response.send_message(embed=embed)
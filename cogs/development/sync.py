@@ -1,22 +1,79 @@
+import asyncio
+import hashlib
 import os
+from typing import Optional
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 from utils.checks import is_owner_or_mod_check
+from utils.serialization import json_dumps
 
 DEV_GUILD_ID = int(os.getenv("DEV_GUILD_ID"))
+SUCCESS_COLOR = 0xBEBEFE
+ERROR_COLOR = 0xE02B2B
+
+# Static replies are built once and reused
+INVALID_SCOPE_EMBED = discord.Embed(
+    description="❌ Invalid scope. Must be `global` or `guild`.", color=ERROR_COLOR
+)
+UNSYNC_INVALID_SCOPE_EMBED = discord.Embed(
+    description="The scope must be `global` or `guild`.", color=ERROR_COLOR
+)
+GLOBAL_UNSYNC_EMBED = discord.Embed(
+    description="Slash commands have been globally unsynchronized.",
+    color=SUCCESS_COLOR,
+)
+SYNC_STARTED_EMBED = discord.Embed(
+    description="⏳ Sync started...", color=SUCCESS_COLOR
+)
+SYNC_BUSY_EMBED = discord.Embed(
+    description="⏳ A sync is already in progress, try again shortly.",
+    color=ERROR_COLOR,
+)
+GUILD_UNSYNC_EMBED = discord.Embed(
+    description="Slash commands have been unsynchronized in this guild.",
+    color=SUCCESS_COLOR,
+)
+GLOBAL_UNCHANGED_EMBED = discord.Embed(
+    description="✅ Global commands are unchanged since the last sync.",
+    color=SUCCESS_COLOR,
+)
+GUILD_UNCHANGED_EMBED = discord.Embed(
+    description="✅ This guild's commands are unchanged since the last sync.",
+    color=SUCCESS_COLOR,
+)
 
 
 class Sync(commands.Cog):
     def __init__(self, bot) -> None:
         self.bot = bot
+        # Only one sync at a time, so concurrent calls don't double the
+        # rate-limited requests to Discord
+        self._sync_lock = asyncio.Lock()
+        # Hash of the command payload last synced, keyed by guild ID
+        # (None for global), so an unchanged tree isn't re-uploaded. It can't
+        # see changes made on Discord's side, so /sync force=True skips it
+        self._synced_hashes: dict[Optional[int], str] = {}
+
+    def _commands_hash(self, guild: Optional[discord.abc.Snowflake]) -> str:
+        """
+        Hash the payload tree.sync would upload for the given scope.
+
+        :param guild: The guild to hash commands for, or None for global commands.
+        """
+        tree = self.bot.tree
+        payload = [command.to_dict(tree) for command in tree.get_commands(guild=guild)]
+        return hashlib.sha256(json_dumps(payload)).hexdigest()
 
     @app_commands.command(
         name="sync",
         description="Synchronizes the slash commands globally or in this guild.",
     )
-    @app_commands.describe(scope="Where to sync the commands: `global` or `guild`")
+    @app_commands.describe(
+        scope="Where to sync the commands: `global` or `guild`",
+        force="Sync even if the commands are unchanged since the last sync",
+    )
     @app_commands.check(is_owner_or_mod_check)
     @app_commands.choices(
         scope=[
@@ -26,29 +83,46 @@ class Sync(commands.Cog):
     )
     @app_commands.guilds(DEV_GUILD_ID)
     async def sync(
-        self, interaction: discord.Interaction, scope: app_commands.Choice[str]
+        self,
+        interaction: discord.Interaction,
+        scope: app_commands.Choice[str],
+        force: bool = False,
     ) -> None:
         await interaction.response.defer(ephemeral=True)
 
-        if scope.value == "global":
-            synced = await self.bot.tree.sync()
-            embed = discord.Embed(
-                description=f"✅ Synced {len(synced)} commands globally.",
-                color=0xBEBEFE,
-            )
-        elif scope.value == "guild":
-            synced = await self.bot.tree.sync(guild=interaction.guild)
-            embed = discord.Embed(
-                description=f"✅ Synced {len(synced)} commands in this guild only.",
-                color=0xBEBEFE,
-            )
-        else:
-            embed = discord.Embed(
-                description="❌ Invalid scope. Must be `global` or `guild`.",
-                color=0xE02B2B,
+        if scope.value not in ("global", "guild"):
+            await interaction.followup.send(embed=INVALID_SCOPE_EMBED)
+            return
+        if self._sync_lock.locked():
+            await interaction.followup.send(embed=SYNC_BUSY_EMBED)
+            return
+
+        guild = None if scope.value == "global" else interaction.guild
+        key = guild.id if guild else None
+        commands_hash = self._commands_hash(guild)
+        if not force and self._synced_hashes.get(key) == commands_hash:
+            await interaction.followup.send(
+                embed=GUILD_UNCHANGED_EMBED if guild else GLOBAL_UNCHANGED_EMBED
             )
+            return
+
+        async with self._sync_lock:
+            # Answer right away; the sync itself can take several seconds
+            await interaction.followup.send(embed=SYNC_STARTED_EMBED)
+            try:
+                synced = await self.bot.tree.sync(guild=guild)
+            except Exception:
+                # The remote state is unknown now, so don't skip the next sync
+                self._synced_hashes.pop(key, None)
+                raise
+            self._synced_hashes[key] = commands_hash
+            if guild is None:
+                description = f"✅ Synced {len(synced)} commands globally."
+            else:
+                description = f"✅ Synced {len(synced)} commands in this guild only."
 
-        await interaction.followup.send(embed=embed)
+        embed = discord.Embed(description=description, color=SUCCESS_COLOR)
+        await interaction.edit_original_response(embed=embed)
 
     @app_commands.command(
         name="unsync",
@@ -75,28 +149,25 @@ class Sync(commands.Cog):
         :param scope: The scope of the sync. Can be `global`, `current_guild` or `guild`.
         """
         await interaction.response.defer()
+        # Overwrite the remote commands with an empty list directly, leaving
+        # the local tree intact so a later /sync can restore them
+        application_id = self.bot.application_id
         if scope.value == "global":
-            self.bot.tree.clear_commands(guild=None)
-            await self.bot.tree.sync()
-            embed = discord.Embed(
-                description="Slash commands have been globally unsynchronized.",
-                color=0xBEBEFE,
-            )
-            await interaction.followup.send(embed=embed)
+            async with self._sync_lock:
+                await self.bot.http.bulk_upsert_global_commands(application_id, [])
+                self._synced_hashes.pop(None, None)
+            await interaction.followup.send(embed=GLOBAL_UNSYNC_EMBED)
             return
         elif scope.value == "guild":
-            self.bot.tree.clear_commands(guild=interaction.guild)
-            await self.bot.tree.sync(guild=interaction.guild)
-            embed = discord.Embed(
-                description="Slash commands have been unsynchronized in this guild.",
-                color=0xBEBEFE,
-            )
-            await interaction.followup.send(embed=embed)
+            guild_id = interaction.guild.id
+            async with self._sync_lock:
+                await self.bot.http.bulk_upsert_guild_commands(
+                    application_id, guild_id, []
+                )
+                self._synced_hashes.pop(guild_id, None)
+            await interaction.followup.send(embed=GUILD_UNSYNC_EMBED)
             return
-        embed = discord.Embed(
-            description="The scope must be `global` or `guild`.", color=0xE02B2B
-        )
-        await interaction.followup.send(embed=embed)
+        await interaction.followup.send(embed=UNSYNC_INVALID_SCOPE_EMBED)
 
 
 async def setup(bot) -> None:
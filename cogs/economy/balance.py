@@ -7,6 +7,7 @@ from utils.checks import is_owner_or_mod_check
 from utils.formatting import format_number
 
 DEV_GUILD_ID = int(os.getenv("DEV_GUILD_ID"))
+BALANCE_COLOR = discord.Color.green()
 
 
 class Balance(BaseGameCog):
@@ -29,12 +30,12 @@ class Balance(BaseGameCog):
         :param user: The user whose balance to check. If None, defaults to the command invoker.
         """
         user = user or interaction.user
-        balance = await self.get_balance(user.id)
+        balance = await self.bot.database.user_db.get_balance_cached(user.id)
 
         embed = discord.Embed(
             title=f"{user.name}'s Balance",
             description=f"💰 ${format_number(balance)}",
-            color=discord.Color.green(),
+            color=BALANCE_COLOR,
         )
         await interaction.response.send_message(embed=embed)
 
@@ -1,11 +1,12 @@
 import asyncio
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import datetime, timezone
 from typing import Optional
 
 import discord
 from discord import app_commands
 from logger import setup_logger
-from utils.balance_helper import calculate_percentage_amount
+from utils.balance_helper import PERCENTAGE_CHOICES, calculate_percentage_amount
 from utils.base_cog import BaseGameCog
 from utils.channels import broadcast_embed_to_guilds
 from utils.embed_builders import build_bank_embed, build_transaction_embed
@@ -13,6 +14,9 @@ from utils.formatting import format_number
 
 logger = setup_logger("Bank")
 
+SECONDS_PER_DAY = 86400
+INTEREST_COLOR = discord.Color.green()
+
 
 class Bank(BaseGameCog):
     def __init__(self, bot):
@@ -29,11 +33,8 @@ class Bank(BaseGameCog):
         await self.bot.wait_until_ready()
 
         while not self.bot.is_closed():
-            now = datetime.now(timezone.utc)
-            next_midnight = (now + timedelta(days=1)).replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
-            wait_seconds = (next_midnight - now).total_seconds()
+            # Unix time has no leap seconds, so days start on multiples of 86400
+            wait_seconds = SECONDS_PER_DAY - time.time() % SECONDS_PER_DAY
 
             logger.info(
                 f"Sleeping {wait_seconds:.0f}s until next 12:00 AM UTC interest update"
@@ -55,37 +56,13 @@ class Bank(BaseGameCog):
             await asyncio.sleep(1)
 
     async def apply_daily_interest(self):
-        user_ids = await self.bot.database.bank_db.get_all_bank_users()
         interest_rate = 0.001
-        user_count = 0
-
-        for user_id in user_ids:
-            user = await self.bot.fetch_user(user_id)
-            if user is None:
-                logger.warning(f"User with ID {user_id} not found.")
-                continue
-
-            bank_stats_raw = await self.bot.database.bank_db.get_user_bank_stats(
-                user_id
-            )
-            bank_stats = dict(bank_stats_raw["bank_stats"])
-            bank_balance = bank_stats["bank_balance"]
-
-            if bank_balance <= 0:
-                continue
-
-            interest = int(bank_balance * interest_rate)
-            if interest == 0:
-                continue
-
-            new_balance = bank_balance + interest
-            await self.bot.database.bank_db.set_bank_balance(user_id, new_balance)
-            user_count += 1
+        user_count = await self.bot.database.bank_db.apply_interest(interest_rate)
 
         embed = discord.Embed(
             title="💸 Interest has been applied to all active bank accounts!",
             description=f"A total of {user_count} users have received their interest for the day.",
-            color=discord.Color.green(),
+            color=INTEREST_COLOR,
             timestamp=datetime.now(timezone.utc),
         )
         await broadcast_embed_to_guilds(self.bot, "interest_channel_id", embed)
@@ -97,18 +74,17 @@ class Bank(BaseGameCog):
     async def get_user_stats(self, user_id: int) -> tuple[int, dict]:
         balance = await self.get_balance(user_id)
         bank_raw = await self.bot.database.bank_db.get_user_bank_stats(user_id)
-        bank_stats = dict(bank_raw["bank_stats"])
-        return balance, bank_stats
+        return balance, bank_raw["bank_stats"]
 
     @app_commands.command(name="bank-balance", description="Check your bank balance.")
     async def bank_balance(
         self, interaction: discord.Interaction, user: Optional[discord.User] = None
     ) -> None:
         user = user or interaction.user
-        bank_balance = await self.bot.database.bank_db.get_bank_balance(user.id)
-        _, bank_stats = await self.get_user_stats(user.id)
+        bank_raw = await self.bot.database.bank_db.get_user_bank_stats_cached(user.id)
+        bank_stats = bank_raw["bank_stats"]
 
-        embed = build_bank_embed(user, bank_stats, bank_balance)
+        embed = build_bank_embed(user, bank_stats, bank_stats["bank_balance"])
         await interaction.response.send_message(embed=embed)
 
     @app_commands.command(name="deposit", description="Deposit money into your bank.")
@@ -116,19 +92,12 @@ class Bank(BaseGameCog):
         amount="Amount to deposit (choose one option or specify your own amount)",
         action="Deposit option (all, half, 25%)",
     )
-    @app_commands.choices(
-        action=[
-            app_commands.Choice(name="100%", value="100%"),
-            app_commands.Choice(name="75%", value="75%"),
-            app_commands.Choice(name="50%", value="50%"),
-            app_commands.Choice(name="25%", value="25%"),
-        ]
-    )
+    @app_commands.choices(action=PERCENTAGE_CHOICES)
     async def deposit(
         self,
         interaction: discord.Interaction,
         amount: Optional[app_commands.Range[int, 1, None]] = None,
-        action: Optional[app_commands.Choice[str]] = None,
+        action: Optional[app_commands.Choice[int]] = None,
     ) -> None:
         user_id = interaction.user.id
 
@@ -136,12 +105,14 @@ class Bank(BaseGameCog):
         if await self.check_blackjack_conflict(user_id, interaction):
             return
 
-        await interaction.response.defer()
-
-        # Validate parameters
-        if not await self.validate_bank_action_params(amount, action, interaction):
+        # Validate parameters BEFORE deferring so mistakes get a single reply
+        if not await self.validate_bank_action_params(
+            amount, action, interaction, deferred=False
+        ):
             return
 
+        await interaction.response.defer()
+
         balance, bank_stats = await self.get_user_stats(user_id)
         available_space = bank_stats["bank_cap"] - bank_stats["bank_balance"]
 
@@ -170,9 +141,8 @@ class Bank(BaseGameCog):
             return
 
         # Update balances
-        await self.deduct_balance(user_id, amount_to_deposit)
-        await self.bot.database.bank_db.set_bank_balance(
-            user_id, bank_stats["bank_balance"] + amount_to_deposit
+        new_wallet, new_bank = await self.bot.database.bank_db.transfer_wallet_to_bank(
+            user_id, amount_to_deposit
         )
 
         # Log transaction
@@ -186,8 +156,8 @@ class Bank(BaseGameCog):
         embed = build_transaction_embed(
             action="Deposit",
             amount=amount_to_deposit,
-            new_bank=bank_stats["bank_balance"] + amount_to_deposit,
-            new_wallet=balance - amount_to_deposit,
+            new_bank=new_bank,
+            new_wallet=new_wallet,
         )
         await interaction.edit_original_response(embed=embed)
 
@@ -196,19 +166,12 @@ class Bank(BaseGameCog):
         amount="Amount to withdraw (choose one option or specify your own amount)",
         action="Withdrawal option (all, half, 25%)",
     )
-    @app_commands.choices(
-        action=[
-            app_commands.Choice(name="100%", value="100%"),
-            app_commands.Choice(name="75%", value="75%"),
-            app_commands.Choice(name="50%", value="50%"),
-            app_commands.Choice(name="25%", value="25%"),
-        ]
-    )
+    @app_commands.choices(action=PERCENTAGE_CHOICES)
     async def withdraw(
         self,
         interaction: discord.Interaction,
         amount: Optional[app_commands.Range[int, 1, None]] = None,
-        action: Optional[app_commands.Choice[str]] = None,
+        action: Optional[app_commands.Choice[int]] = None,
     ) -> None:
         user_id = interaction.user.id
 
@@ -216,12 +179,14 @@ class Bank(BaseGameCog):
         if await self.check_blackjack_conflict(user_id, interaction):
             return
 
-        await interaction.response.defer()
-
-        # Validate parameters
-        if not await self.validate_bank_action_params(amount, action, interaction):
+        # Validate parameters BEFORE deferring so mistakes get a single reply
+        if not await self.validate_bank_action_params(
+            amount, action, interaction, deferred=False
+        ):
             return
 
+        await interaction.response.defer()
+
         balance, bank_stats = await self.get_user_stats(user_id)
         bank_balance = bank_stats["bank_balance"]
 
@@ -240,10 +205,9 @@ class Bank(BaseGameCog):
             return
 
         # Update balances
-        await self.bot.database.bank_db.set_bank_balance(
-            user_id, bank_balance - amount_to_withdraw
+        new_wallet, new_bank = await self.bot.database.bank_db.transfer_bank_to_wallet(
+            user_id, amount_to_withdraw
         )
-        await self.add_balance(user_id, amount_to_withdraw)
 
         # Log transaction
         self.log_transaction(
@@ -256,8 +220,8 @@ class Bank(BaseGameCog):
         embed = build_transaction_embed(
             action="Withdrawal",
             amount=amount_to_withdraw,
-            new_bank=bank_balance - amount_to_withdraw,
-            new_wallet=balance + amount_to_withdraw,
+            new_bank=new_bank,
+            new_wallet=new_wallet,
         )
         await interaction.edit_original_response(embed=embed)
 
@@ -7,7 +7,7 @@ from typing import Optional
 import discord
 from constants.game_config import GameEventType
 from discord import app_commands
-from utils.balance_helper import calculate_percentage_amount
+from utils.balance_helper import PERCENTAGE_CHOICES, calculate_percentage_amount
 from utils.base_cog import BaseGameCog
 from utils.formatting import format_number
 
@@ -257,7 +257,7 @@ def create_result_embed(
 
 
 async def perform_blackjack(
-    bot, interaction, user_id: int, amount: int, action: Optional[str], balance: int
+    bot, interaction, user_id: int, amount: int, action: Optional[int], balance: int
 ):
     """Execute a blackjack game."""
     stats_raw = await bot.database.game_db.get_user_game_stats(user_id)
@@ -327,21 +327,14 @@ class Blackjack(BaseGameCog):
     @app_commands.describe(
         amount="The amount to bet", action="Choose a percentage of your balance"
     )
-    @app_commands.choices(
-        action=[
-            app_commands.Choice(name="100%", value="100%"),
-            app_commands.Choice(name="75%", value="75%"),
-            app_commands.Choice(name="50%", value="50%"),
-            app_commands.Choice(name="25%", value="25%"),
-        ]
-    )
+    @app_commands.choices(action=PERCENTAGE_CHOICES)
     @app_commands.allowed_installs(guilds=True, users=True)
     @app_commands.allowed_contexts(guilds=True, dms=True, private_channels=True)
     async def blackjack(
         self,
         interaction: discord.Interaction,
         amount: Optional[app_commands.Range[int, 1, None]] = None,
-        action: Optional[app_commands.Choice[str]] = None,
+        action: Optional[app_commands.Choice[int]] = None,
     ) -> None:
         """Blackjack command."""
         user_id = interaction.user.id
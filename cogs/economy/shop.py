@@ -40,7 +40,7 @@ class Shop(BaseGameCog):
         if item is None:
             bank_raw = await self.bot.database.bank_db.get_user_bank_stats(user_id)
             user_levels = {
-                "bank_level": dict(bank_raw["bank_stats"]).get("bank_level", 1),
+                "bank_level": bank_raw["bank_stats"]["bank_level"],
                 **work_stats,
             }
 
@@ -85,7 +85,7 @@ class Shop(BaseGameCog):
 
         if item_key == "bank_upgrade":
             bank_raw = await self.bot.database.bank_db.get_user_bank_stats(user_id)
-            level = max(1, dict(bank_raw["bank_stats"]).get("bank_level", 1))
+            level = max(1, bank_raw["bank_stats"]["bank_level"])
             cost = item_data["base_price"] + (level - 1) * item_data["price_increment"]
         else:
             cost = item_data["price"]
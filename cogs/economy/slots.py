@@ -5,6 +5,7 @@ from typing import Optional
 import discord
 from discord import app_commands
 from logger import setup_logger
+from utils.balance_helper import PERCENTAGE_CHOICES
 from utils.base_cog import BaseGameCog
 from utils.formatting import format_number
 from utils.gambling_handler import GameResult
@@ -105,21 +106,14 @@ class Slots(BaseGameCog):
     @app_commands.describe(
         amount="The amount to bet", action="Choose a percentage of your balance"
     )
-    @app_commands.choices(
-        action=[
-            app_commands.Choice(name="100%", value="100%"),
-            app_commands.Choice(name="75%", value="75%"),
-            app_commands.Choice(name="50%", value="50%"),
-            app_commands.Choice(name="25%", value="25%"),
-        ]
-    )
+    @app_commands.choices(action=PERCENTAGE_CHOICES)
     @app_commands.allowed_installs(guilds=True, users=True)
     @app_commands.allowed_contexts(guilds=True, dms=True, private_channels=True)
     async def slots(
         self,
         interaction: discord.Interaction,
         amount: Optional[app_commands.Range[int, 1, None]] = None,
-        action: Optional[app_commands.Choice[str]] = None,
+        action: Optional[app_commands.Choice[int]] = None,
     ) -> None:
         """Slots command using unified handler."""
         await self.run_gambling_command(
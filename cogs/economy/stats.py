@@ -4,6 +4,40 @@ from discord.ext import commands
 from utils.equips import format_tool_display_name, get_tool_bonus
 from utils.formatting import format_number
 
+# Games shown in game stats, with their won/lost/played/winnings/losses columns
+GAME_STAT_BLOCKS = (
+    (
+        "Rolls",
+        (
+            "rolls_won",
+            "rolls_lost",
+            "rolls_played",
+            "rolls_total_won",
+            "rolls_total_lost",
+        ),
+    ),
+    (
+        "Blackjacks",
+        (
+            "blackjacks_won",
+            "blackjacks_lost",
+            "blackjacks_played",
+            "blackjacks_total_won",
+            "blackjacks_total_lost",
+        ),
+    ),
+    (
+        "Slots",
+        (
+            "slots_won",
+            "slots_lost",
+            "slots_played",
+            "slots_total_won",
+            "slots_total_lost",
+        ),
+    ),
+)
+
 
 class Stats(commands.Cog):
     def __init__(self, bot):
@@ -47,36 +81,6 @@ class Stats(commands.Cog):
         stats = await self.bot.database.game_db.get_user_game_stats(user.id)
         game_stats = stats["game_stats"]
 
-        # Convert list to dict with descriptive keys
-        keys = [
-            "user_id",
-            "rolls_won",
-            "rolls_lost",
-            "rolls_played",
-            "rolls_won_amt",
-            "rolls_lost_amt",
-            "blackjacks_won",
-            "blackjacks_lost",
-            "blackjacks_played",
-            "blackjacks_won_amt",
-            "blackjacks_lost_amt",
-            "slots_won",
-            "slots_lost",
-            "slots_played",
-            "slots_won_amt",
-            "slots_lost_amt",
-            "wordles_won",
-            "wordles_lost",
-            "wordles_played",
-            "roulettes_won",
-            "roulettes_lost",
-            "roulettes_played",
-            "roulettes_won_amt",
-            "roulettes_lost_amt",
-            "duel_stats_json",
-        ]
-        stats_dict = dict(zip(keys, game_stats))
-
         # Create structured embed
         embed = discord.Embed(
             title=f"{user.display_name}'s Game Stats", color=discord.Color.teal()
@@ -111,32 +115,8 @@ class Stats(commands.Cog):
             )
 
         # Add game blocks
-        add_game_block(
-            "Rolls",
-            stats_dict["rolls_won"],
-            stats_dict["rolls_lost"],
-            stats_dict["rolls_played"],
-            stats_dict["rolls_won_amt"],
-            stats_dict["rolls_lost_amt"],
-        )
-
-        add_game_block(
-            "Blackjacks",
-            stats_dict["blackjacks_won"],
-            stats_dict["blackjacks_lost"],
-            stats_dict["blackjacks_played"],
-            stats_dict["blackjacks_won_amt"],
-            stats_dict["blackjacks_lost_amt"],
-        )
-
-        add_game_block(
-            "Slots",
-            stats_dict["slots_won"],
-            stats_dict["slots_lost"],
-            stats_dict["slots_played"],
-            stats_dict["slots_won_amt"],
-            stats_dict["slots_lost_amt"],
-        )
+        for name, columns in GAME_STAT_BLOCKS:
+            add_game_block(name, *(game_stats[column] for column in columns))
 
         embed.set_footer(text="🧠 Keep grinding and improve your stats!")
         await interaction.response.send_message(embed=embed)
@@ -49,17 +49,17 @@ class AIDatabaseManager:
 
     @db_error_handler
     async def get_user_history(
-        self, user_id: int, limit: int = 12
+        self, user_id: int, limit: int = 6
     ) -> list[tuple[str, str]]:
         """
         Get conversation history for a user.
 
         Args:
             user_id: Discord user ID
-            limit: Number of messages to retrieve (default 12, means 6 exchanges)
+            limit: Number of exchanges to retrieve (default 6)
 
         Returns:
-            List of (user_message, bot_response) tuples, newest first
+            List of (user_message, bot_response) tuples, oldest first
         """
         try:
             cursor = await self.connection.execute(
@@ -1,15 +1,21 @@
 import aiosqlite
 from logger import setup_logger
 from utils.database_errors import db_error_handler
+from utils.ttl_cache import TTLCache
 
 logger = setup_logger("BankDatabaseManager")
 
+# Bank stats shown by display-only commands may be this many seconds old
+BANK_STATS_CACHE_TTL = 60
+BANK_STATS_CACHE_SIZE = 1024
+
 
 class BankDatabaseManager:
 
     def __init__(self, connection: aiosqlite.Connection, db_manager):
         self.connection = connection
         self.db_manager = db_manager
+        self._bank_stats_cache = TTLCache(BANK_STATS_CACHE_SIZE, BANK_STATS_CACHE_TTL)
 
     @db_error_handler
     async def get_bank_balance(self, user_id: int) -> int:
@@ -38,6 +44,19 @@ class BankDatabaseManager:
             "bank_stats": bank_stats,
         }
 
+    async def get_user_bank_stats_cached(self, user_id: int) -> dict:
+        """
+        This function will return the bank stats of a user, reusing a recent read.
+        Only use it for display; deposits and withdrawals should call get_user_bank_stats.
+
+        :param user_id: The ID of the user whose bank stats should be returned.
+        """
+        bank_stats = self._bank_stats_cache.get(user_id)
+        if bank_stats is None:
+            bank_stats = await self.get_user_bank_stats(user_id)
+            self._bank_stats_cache.set(user_id, bank_stats)
+        return bank_stats
+
     @db_error_handler
     async def set_bank_balance(self, user_id: int, amount) -> None:
         """
@@ -60,6 +79,93 @@ class BankDatabaseManager:
                 """,
                 (user_id, amount),
             )
+        self._bank_stats_cache.pop(user_id)
+
+    @db_error_handler
+    async def transfer_wallet_to_bank(
+        self, user_id: int, amount: int
+    ) -> tuple[int, int]:
+        """
+        This function will move money from a user's wallet into their bank in one transaction.
+
+        :param user_id: The ID of the user making the deposit
+        :param amount: The amount to move into the bank
+        :return: The new wallet balance and the new bank balance
+        """
+        await self.db_manager._create_user_if_not_exists(user_id)
+
+        async with self.db_manager.transaction():
+            async with self.connection.execute(
+                """
+                UPDATE users
+                SET balance = balance - ?
+                WHERE user_id = ? AND balance >= ?
+                RETURNING balance
+                """,
+                (amount, user_id, amount),
+            ) as cursor:
+                wallet_row = await cursor.fetchone()
+            if wallet_row is None:
+                raise ValueError("Insufficient balance for deposit.")
+
+            async with self.connection.execute(
+                """
+                UPDATE user_bank_stats
+                SET bank_balance = bank_balance + ?
+                WHERE user_id = ? AND bank_balance + ? <= bank_cap
+                RETURNING bank_balance
+                """,
+                (amount, user_id, amount),
+            ) as cursor:
+                bank_row = await cursor.fetchone()
+            if bank_row is None:
+                raise ValueError("Deposit would exceed bank capacity.")
+
+        self.db_manager.user_db.invalidate_balance_cache(user_id)
+        self._bank_stats_cache.pop(user_id)
+        return wallet_row[0], bank_row[0]
+
+    @db_error_handler
+    async def transfer_bank_to_wallet(
+        self, user_id: int, amount: int
+    ) -> tuple[int, int]:
+        """
+        This function will move money from a user's bank into their wallet in one transaction.
+
+        :param user_id: The ID of the user making the withdrawal
+        :param amount: The amount to move out of the bank
+        :return: The new wallet balance and the new bank balance
+        """
+        await self.db_manager._create_user_if_not_exists(user_id)
+
+        async with self.db_manager.transaction():
+            async with self.connection.execute(
+                """
+                UPDATE user_bank_stats
+                SET bank_balance = bank_balance - ?
+                WHERE user_id = ? AND bank_balance >= ?
+                RETURNING bank_balance
+                """,
+                (amount, user_id, amount),
+            ) as cursor:
+                bank_row = await cursor.fetchone()
+            if bank_row is None:
+                raise ValueError("Insufficient bank balance for withdrawal.")
+
+            async with self.connection.execute(
+                """
+                UPDATE users
+                SET balance = balance + ?
+                WHERE user_id = ?
+                RETURNING balance
+                """,
+                (amount, user_id),
+            ) as cursor:
+                wallet_row = await cursor.fetchone()
+
+        self.db_manager.user_db.invalidate_balance_cache(user_id)
+        self._bank_stats_cache.pop(user_id)
+        return wallet_row[0], bank_row[0]
 
     @db_error_handler
     async def set_bank_level_and_cap(self, user_id: int) -> None:
@@ -86,6 +192,7 @@ class BankDatabaseManager:
                 """,
                 (new_level, new_cap, user_id),
             )
+        self._bank_stats_cache.pop(user_id)
 
     @db_error_handler
     async def get_all_bank_users(self) -> list[int]:
@@ -94,3 +201,24 @@ class BankDatabaseManager:
         ) as cursor:
             rows = await cursor.fetchall()
         return [row[0] for row in rows]
+
+    @db_error_handler
+    async def apply_interest(self, rate: float) -> int:
+        """
+        This function will add interest to every bank account in a single update.
+
+        :param rate: The interest rate applied to each positive bank balance
+        :return: The number of users whose bank balance increased
+        """
+        async with self.db_manager.transaction():
+            async with self.connection.execute(
+                """
+                UPDATE user_bank_stats
+                SET bank_balance = bank_balance + CAST(bank_balance * ? AS INTEGER)
+                WHERE bank_balance > 0 AND CAST(bank_balance * ? AS INTEGER) > 0
+                """,
+                (rate, rate),
+            ) as cursor:
+                user_count = cursor.rowcount
+        self._bank_stats_cache.clear()
+        return user_count
@@ -21,6 +21,13 @@ class GuildSettingsDatabaseManager:
             "osrs_below_avg_channel_id": "osrs_below_avg_channel_id",
         }
 
+        # (guild_id, channel_type) -> channel ID or None, kept in sync by
+        # set_channel/remove_channel so hot lookups (mod logs) skip the DB
+        self._channel_cache: dict[tuple[int, str], int | None] = {}
+        # Bumped on every channel write; a read only fills the cache if no
+        # write landed while it was in flight, so it can't restore a stale ID
+        self._channel_writes = 0
+
     def _validate_channel_type(self, channel_type: str) -> None:
         """
         Validate that the channel type is supported.
@@ -89,6 +96,8 @@ class GuildSettingsDatabaseManager:
                     """,
                     (guild_id, channel_id),
                 )
+            self._channel_cache[(guild_id, channel_type)] = channel_id
+            self._channel_writes += 1
             logger.info(
                 f"Set {channel_type} to channel {channel_id} for guild {guild_id}"
             )
@@ -113,7 +122,13 @@ class GuildSettingsDatabaseManager:
             ValueError: If channel_type is invalid
         """
         self._validate_channel_type(channel_type)
+
+        key = (guild_id, channel_type)
+        if key in self._channel_cache:
+            return self._channel_cache[key]
+
         column_name = self._get_safe_column_name(channel_type)
+        writes = self._channel_writes
 
         try:
             async with self.connection.execute(
@@ -123,12 +138,49 @@ class GuildSettingsDatabaseManager:
                 row = await cursor.fetchone()
 
             result = row[0] if row else None
+            if writes == self._channel_writes:
+                self._channel_cache[key] = result
             logger.debug(f"Retrieved {channel_type} for guild {guild_id}: {result}")
             return result
         except Exception as e:
             logger.error(f"Error getting channel: {e}", exc_info=True)
             return None
 
+    @db_error_handler
+    async def get_all_channels(self, channel_type: str) -> dict[int, int]:
+        """
+        Get the channel ID of the specified type for every guild that set one.
+
+        Args:
+            channel_type: Database field name (e.g., 'interest_channel_id')
+
+        Returns:
+            Dictionary mapping guild IDs to channel IDs
+
+        Raises:
+            ValueError: If channel_type is invalid
+        """
+        self._validate_channel_type(channel_type)
+        column_name = self._get_safe_column_name(channel_type)
+        writes = self._channel_writes
+
+        try:
+            async with self.connection.execute(
+                f"SELECT guild_id, {column_name} FROM guild_settings "
+                f"WHERE {column_name} IS NOT NULL"
+            ) as cursor:
+                rows = await cursor.fetchall()
+
+            channels = {guild_id: channel_id for guild_id, channel_id in rows}
+            if writes == self._channel_writes:
+                for guild_id, channel_id in channels.items():
+                    self._channel_cache[(guild_id, channel_type)] = channel_id
+            logger.debug(f"Retrieved {channel_type} for {len(channels)} guilds")
+            return channels
+        except Exception as e:
+            logger.error(f"Error getting all channels: {e}", exc_info=True)
+            return {}
+
     @db_error_handler
     async def get_all_settings(self, guild_id: int) -> dict:
         """
@@ -189,6 +241,8 @@ class GuildSettingsDatabaseManager:
                     (guild_id,),
                 )
                 removed = cursor.rowcount > 0
+                self._channel_cache.pop((guild_id, channel_type), None)
+                self._channel_writes += 1
 
                 if removed:
                     logger.info(f"Removed {channel_type} from guild {guild_id}")
@@ -251,6 +305,9 @@ class GuildSettingsDatabaseManager:
                     (guild_id,),
                 )
 
+            for channel_type in self.COLUMN_MAP:
+                self._channel_cache.pop((guild_id, channel_type), None)
+            self._channel_writes += 1
             logger.info(f"Reset all channels for guild {guild_id}")
             return True
         except Exception as e:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import List, Optional
 
 import aiosqlite
@@ -45,6 +46,43 @@ class MessageLoggerDatabaseManager:
                 ),
             )
 
+    @db_error_handler
+    async def log_message_batch(
+        self,
+        new_messages: List[tuple],
+        content_updates: List[tuple],
+        deletions: List[tuple],
+    ) -> None:
+        """
+        Apply queued message log writes in a single transaction.
+
+        Args:
+            new_messages: (message_id, guild_id, channel_id, author_id, content,
+                attachments_json, created_at) rows to insert, ignoring duplicates
+            content_updates: (new_content, message_id) pairs
+            deletions: (deleted_at, message_id) pairs
+        """
+        async with self.db_manager.transaction():
+            if new_messages:
+                await self.connection.executemany(
+                    """
+                    INSERT OR IGNORE INTO message_logs (
+                        message_id, guild_id, channel_id, author_id, content, attachments, created_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    new_messages,
+                )
+            if content_updates:
+                await self.connection.executemany(
+                    "UPDATE message_logs SET content = ? WHERE message_id = ?",
+                    content_updates,
+                )
+            if deletions:
+                await self.connection.executemany(
+                    "UPDATE message_logs SET deleted_at = ? WHERE message_id = ?",
+                    deletions,
+                )
+
     @db_error_handler
     async def update_message_edit(
         self,
@@ -116,13 +154,39 @@ class MessageLoggerDatabaseManager:
             return [dict(zip(columns, row)) for row in rows]
 
     @db_error_handler
-    async def delete_old_logs(self, cutoff_iso_timestamp: str) -> None:
-        """Delete message logs older than a given ISO timestamp."""
-        async with self.db_manager.transaction():
-            await self.connection.execute(
-                """
-                DELETE FROM message_logs
-                WHERE created_at < ?
-                """,
-                (cutoff_iso_timestamp,),
-            )
+    async def delete_old_logs(
+        self, cutoff_iso_timestamp: str, batch_size: int = 5000
+    ) -> int:
+        """
+        Delete message logs older than a given ISO timestamp.
+
+        Rows are removed in batches, each in its own short transaction, so a
+        large purge never holds the write lock long enough to stall logging.
+
+        Args:
+            cutoff_iso_timestamp: Delete rows created before this time
+            batch_size: Maximum rows deleted per transaction
+
+        Returns:
+            Total number of rows deleted
+        """
+        total = 0
+        while True:
+            async with self.db_manager.transaction():
+                cursor = await self.connection.execute(
+                    """
+                    DELETE FROM message_logs
+                    WHERE rowid IN (
+                        SELECT rowid FROM message_logs
+                        WHERE created_at < ?
+                        LIMIT ?
+                    )
+                    """,
+                    (cutoff_iso_timestamp, batch_size),
+                )
+                deleted = cursor.rowcount
+            total += deleted
+            if deleted < batch_size:
+                return total
+            # Let queued writes run between batches
+            await asyncio.sleep(0)
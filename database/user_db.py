@@ -1,15 +1,21 @@
 import aiosqlite
 from logger import setup_logger
 from utils.database_errors import db_error_handler
+from utils.ttl_cache import TTLCache
 
 logger = setup_logger("UserDatabaseManager")
 
+# Balances shown by display-only commands may be this many seconds old
+BALANCE_CACHE_TTL = 60
+BALANCE_CACHE_SIZE = 1024
+
 
 class UserDatabaseManager:
 
     def __init__(self, connection: aiosqlite.Connection, db_manager):
         self.connection = connection
         self.db_manager = db_manager
+        self._balance_cache = TTLCache(BALANCE_CACHE_SIZE, BALANCE_CACHE_TTL)
 
     @db_error_handler
     async def get_balance(self, user_id: int) -> int:
@@ -20,6 +26,27 @@ class UserDatabaseManager:
             row = await cursor.fetchone()
         return row[0]
 
+    async def get_balance_cached(self, user_id: int) -> int:
+        """
+        This function will return the balance of a user, reusing a recent read.
+        Only use it for display; anything that spends money should call get_balance.
+
+        :param user_id: The ID of the user whose balance should be returned
+        """
+        balance = self._balance_cache.get(user_id)
+        if balance is None:
+            balance = await self.get_balance(user_id)
+            self._balance_cache.set(user_id, balance)
+        return balance
+
+    def invalidate_balance_cache(self, user_id: int) -> None:
+        """
+        Drop the cached balance of a user after writing it outside this manager.
+
+        :param user_id: The ID of the user whose balance changed
+        """
+        self._balance_cache.pop(user_id)
+
     @db_error_handler
     async def set_balance(self, user_id: int, amount: int) -> None:
         """
@@ -42,6 +69,7 @@ class UserDatabaseManager:
                 """,
                 (user_id, amount),
             )
+        self._balance_cache.pop(user_id)
 
     @db_error_handler
     async def increment_balance(self, user_id: int, amount: int) -> int:
@@ -67,7 +95,8 @@ class UserDatabaseManager:
                 row = await cursor.fetchone()
                 if row is None:
                     raise ValueError("Resulting balance would be negative.")
-                return row[0]
+        self._balance_cache.pop(user_id)
+        return row[0]
 
     @db_error_handler
     async def get_daily(self, user_id: int) -> tuple[int, str | None]:
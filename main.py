@@ -59,6 +59,10 @@ class MyBot(commands.Bot):
         logged_folders = set()
 
         for name in cogs_to_load:
+            # on_ready fires again after reconnects; never register a cog twice
+            if name in self.extensions:
+                continue
+
             parts = name.split(".")
             # e.g. 'cogs.moderation.some_cog' => top_level_name = 'cogs.moderation'
             top_level_name = ".".join(parts[:2]) if len(parts) >= 2 else name
@@ -1,7 +1,16 @@
 from typing import Optional
 
+from discord import app_commands
 from utils.formatting import format_number
 
+# Balance percentage options shared by the bank and gambling commands
+PERCENTAGE_CHOICES = [
+    app_commands.Choice(name="100%", value=100),
+    app_commands.Choice(name="75%", value=75),
+    app_commands.Choice(name="50%", value=50),
+    app_commands.Choice(name="25%", value=25),
+]
+
 
 def validate_amount(amount: Optional[int], balance: int) -> Optional[str]:
     if balance <= 0:
@@ -13,13 +22,7 @@ def validate_amount(amount: Optional[int], balance: int) -> Optional[str]:
     return None
 
 
-def calculate_percentage_amount(balance: int, action: Optional[str]) -> Optional[int]:
-    if action == "100%":
-        return balance
-    elif action == "75%":
-        return (balance * 75) // 100
-    elif action == "50%":
-        return balance // 2
-    elif action == "25%":
-        return balance // 4
-    return None
+def calculate_percentage_amount(balance: int, percent: Optional[int]) -> Optional[int]:
+    if percent is None:
+        return None
+    return balance * percent // 100
@@ -87,7 +87,8 @@ class BaseGameCog(commands.Cog):
             amount: Optional specific amount
             action: Optional percentage action (100%, 75%, 50%, 25%)
             interaction: Discord interaction
-            deferred: Whether response is already deferred
+            deferred: Whether response is already deferred (if not, the
+                error is sent as an ephemeral reply)
 
         Returns:
             bool: True if valid, False otherwise (error message sent)
@@ -97,28 +98,17 @@ class BaseGameCog(commands.Cog):
                 return
         """
         if not action and not amount:
-            send_method = (
-                interaction.edit_original_response
-                if deferred
-                else interaction.response.send_message
-            )
-            await send_method(
-                content="You must specify an amount or choose a deposit/withdrawal option.",
-            )
-            return False
-
-        if amount and action:
-            send_method = (
-                interaction.edit_original_response
-                if deferred
-                else interaction.response.send_message
-            )
-            await send_method(
-                content="You can only choose one option: amount or action."
-            )
-            return False
+            error = "You must specify an amount or choose a deposit/withdrawal option."
+        elif amount and action:
+            error = "You can only choose one option: amount or action."
+        else:
+            return True
 
-        return True
+        if deferred:
+            await interaction.edit_original_response(content=error)
+        else:
+            await interaction.response.send_message(content=error, ephemeral=True)
+        return False
 
     async def get_balance(self, user_id: int) -> int:
         """Fetch user's current balance."""
@@ -177,6 +167,8 @@ class BaseGameCog(commands.Cog):
                     raise ValueError("Failed to add balance to recipient.")
                 to_balance = row[0]
 
+        self.bot.database.user_db.invalidate_balance_cache(from_user_id)
+        self.bot.database.user_db.invalidate_balance_cache(to_user_id)
         self.log_transaction(from_user_id, log_action, amount, f"To: {to_user_id}")
 
         return from_balance, to_balance
@@ -301,7 +293,7 @@ class BaseGameCog(commands.Cog):
         self,
         interaction: discord.Interaction,
         amount: int,
-        action: str,
+        action: int,
         game_func,
         game_name: str = "Game",
         balance: int = None,
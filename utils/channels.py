@@ -1,3 +1,6 @@
+import asyncio
+from typing import Optional
+
 import discord
 from logger import setup_logger
 
@@ -17,6 +20,19 @@ CHANNEL_TYPES = {
 # Extract valid DB keys for validation
 VALID_CHANNEL_TYPES = set(CHANNEL_TYPES.values())
 
+# Mod log embeds are held this many seconds so bursts go out together
+MOD_LOG_FLUSH_DELAY = 0.5
+# Discord's limits on embeds per message and their combined text length
+MOD_LOG_MAX_EMBEDS = 10
+MOD_LOG_MAX_CHARS = 6000
+# Broadcasts work on at most this many guilds at a time
+BROADCAST_CONCURRENCY = 10
+
+# Per guild: embeds waiting to be sent (with the future the caller awaits,
+# if any) and the task that will send them
+_pending_mod_logs: dict[int, list[tuple[discord.Embed, Optional[asyncio.Future]]]] = {}
+_mod_log_flushers: dict[int, asyncio.Task] = {}
+
 
 def get_channel_display_info(channel_type: str) -> dict:
     """
@@ -75,37 +91,25 @@ def get_channel_display_info(channel_type: str) -> dict:
     )
 
 
-async def broadcast_embed_to_guilds(
-    bot, channel_type: str, embed: discord.Embed, view: discord.ui.View = None
-) -> dict:
+async def _broadcast_to_guild(
+    bot,
+    guild: discord.Guild,
+    channel_id: Optional[int],
+    embed: discord.Embed,
+    view: Optional[discord.ui.View],
+    semaphore: asyncio.Semaphore,
+) -> str:
     """
-    Broadcast an embed to a specific channel type across all guilds.
-
-    Args:
-        bot: Discord bot instance
-        channel_type: Database field name (e.g., 'leaderboard_announcements_channel_id')
-        embed: Discord embed to send
-        view: Optional Discord view with buttons/interactions
+    Send a broadcast embed to one guild's configured channel.
 
     Returns:
-        Dict with statistics about the broadcast
+        The broadcast stats key describing the outcome
     """
-    stats = {
-        "sent": 0,
-        "failed": 0,
-        "no_channel": 0,
-        "permission_error": 0,
-        "not_found": 0,
-    }
-
-    for guild in bot.guilds:
-        try:
-            channel_id = await bot.database.guild_db.get_channel(guild.id, channel_type)
-
-            if not channel_id:
-                stats["no_channel"] += 1
-                continue
+    if not channel_id:
+        return "no_channel"
 
+    try:
+        async with semaphore:
             try:
                 # Fetch channel (works even for archived threads)
                 channel = await bot.fetch_channel(channel_id)
@@ -113,14 +117,12 @@ async def broadcast_embed_to_guilds(
                 logger.warning(
                     f"Channel {channel_id} not found in guild {guild.id} ({guild.name})"
                 )
-                stats["not_found"] += 1
-                continue
+                return "not_found"
             except discord.Forbidden:
                 logger.warning(
                     f"Cannot access channel {channel_id} in guild {guild.id} ({guild.name})"
                 )
-                stats["permission_error"] += 1
-                continue
+                return "permission_error"
 
             # Unarchive thread if necessary
             if isinstance(channel, discord.Thread) and channel.archived:
@@ -133,31 +135,69 @@ async def broadcast_embed_to_guilds(
                     logger.warning(
                         f"Cannot unarchive thread {channel.name} ({channel.id}) in guild {guild.id}"
                     )
-                    stats["permission_error"] += 1
-                    continue
+                    return "permission_error"
 
             # Send the embed
             try:
                 await channel.send(embed=embed, view=view)
-                stats["sent"] += 1
                 logger.debug(f"Sent embed to {channel.name} in guild {guild.name}")
+                return "sent"
             except discord.Forbidden:
                 logger.warning(
                     f"Missing permission to send messages in {channel.name} ({channel.id}) for guild {guild.name} ({guild.id})"
                 )
-                stats["permission_error"] += 1
+                return "permission_error"
             except discord.HTTPException as e:
                 logger.error(
                     f"Failed to send embed to {channel.name} ({channel.id}) in guild {guild.name} ({guild.id}): {e}"
                 )
-                stats["failed"] += 1
+                return "failed"
+
+    except Exception as e:
+        logger.error(
+            f"Unexpected error broadcasting to guild {guild.id}: {e}",
+            exc_info=True,
+        )
+        return "failed"
+
+
+async def broadcast_embed_to_guilds(
+    bot, channel_type: str, embed: discord.Embed, view: discord.ui.View = None
+) -> dict:
+    """
+    Broadcast an embed to a specific channel type across all guilds.
+
+    Args:
+        bot: Discord bot instance
+        channel_type: Database field name (e.g., 'leaderboard_announcements_channel_id')
+        embed: Discord embed to send
+        view: Optional Discord view with buttons/interactions
 
-        except Exception as e:
-            logger.error(
-                f"Unexpected error broadcasting to guild {guild.id}: {e}",
-                exc_info=True,
+    Returns:
+        Dict with statistics about the broadcast
+    """
+    stats = {
+        "sent": 0,
+        "failed": 0,
+        "no_channel": 0,
+        "permission_error": 0,
+        "not_found": 0,
+    }
+
+    # Send to several guilds at once, but few enough to stay clear of
+    # Discord's global rate limit
+    semaphore = asyncio.Semaphore(BROADCAST_CONCURRENCY)
+    channel_ids = await bot.database.guild_db.get_all_channels(channel_type)
+    results = await asyncio.gather(
+        *(
+            _broadcast_to_guild(
+                bot, guild, channel_ids.get(guild.id), embed, view, semaphore
             )
-            stats["failed"] += 1
+            for guild in bot.guilds
+        )
+    )
+    for result in results:
+        stats[result] += 1
 
     # Log summary
     logger.info(
@@ -176,6 +216,9 @@ async def send_to_mod_log(
     """
     Send a message to a guild's mod log channel.
 
+    Embeds for the same guild that arrive within MOD_LOG_FLUSH_DELAY of each
+    other are coalesced and sent together, up to 10 per message.
+
     Args:
         bot: Discord bot instance
         guild: Discord guild
@@ -189,6 +232,92 @@ async def send_to_mod_log(
         logger.warning("Cannot send mod log: guild is None")
         return False
 
+    # Add reason to embed if provided
+    if reason:
+        embed.add_field(name="Reason", value=reason, inline=False)
+
+    sent = asyncio.get_running_loop().create_future()
+    _enqueue_mod_log(bot, guild, embed, sent)
+    return await sent
+
+
+def queue_mod_log(bot, guild: discord.Guild, embed: discord.Embed) -> None:
+    """
+    Queue an embed for a guild's mod log channel without waiting for it.
+
+    Same delivery as send_to_mod_log, for event listeners that don't need
+    the result and shouldn't wait out the coalescing window.
+
+    Args:
+        bot: Discord bot instance
+        guild: Discord guild
+        embed: Discord embed to send
+    """
+    if not guild:
+        logger.warning("Cannot send mod log: guild is None")
+        return
+
+    _enqueue_mod_log(bot, guild, embed, None)
+
+
+def _enqueue_mod_log(
+    bot,
+    guild: discord.Guild,
+    embed: discord.Embed,
+    sent: Optional[asyncio.Future],
+) -> None:
+    """Add an embed to the guild's pending batch, starting a flush if needed."""
+    _pending_mod_logs.setdefault(guild.id, []).append((embed, sent))
+    if guild.id not in _mod_log_flushers:
+        _mod_log_flushers[guild.id] = asyncio.create_task(_flush_mod_log(bot, guild))
+
+
+async def _flush_mod_log(bot, guild: discord.Guild) -> None:
+    """Send a guild's pending mod log embeds once the coalescing window ends."""
+    await asyncio.sleep(MOD_LOG_FLUSH_DELAY)
+    try:
+        # Embeds queued while a batch is being sent are picked up next round
+        while pending := _pending_mod_logs.pop(guild.id, None):
+            for batch in _split_mod_log_batches(pending):
+                ok = await _send_mod_log_batch(
+                    bot, guild, [embed for embed, _ in batch]
+                )
+                for _, sent in batch:
+                    if sent is not None and not sent.done():
+                        sent.set_result(ok)
+    finally:
+        _mod_log_flushers.pop(guild.id, None)
+
+
+def _split_mod_log_batches(pending: list) -> list[list]:
+    """Split pending (embed, future) pairs into batches Discord will accept."""
+    batches = []
+    batch = []
+    size = 0
+    for item in pending:
+        embed_size = len(item[0])
+        if batch and (
+            len(batch) == MOD_LOG_MAX_EMBEDS or size + embed_size > MOD_LOG_MAX_CHARS
+        ):
+            batches.append(batch)
+            batch = []
+            size = 0
+        batch.append(item)
+        size += embed_size
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+async def _send_mod_log_batch(
+    bot, guild: discord.Guild, embeds: list[discord.Embed]
+) -> bool:
+    """
+    Send up to 10 embeds to a guild's mod log channel in one message.
+
+    Returns:
+        True if successful, False otherwise
+    """
     try:
         mod_log_id = await bot.database.guild_db.get_channel(
             guild.id, "mod_log_channel_id"
@@ -206,12 +335,8 @@ async def send_to_mod_log(
             )
             return False
 
-        # Add reason to embed if provided
-        if reason:
-            embed.add_field(name="Reason", value=reason, inline=False)
-
-        await channel.send(embed=embed)
-        logger.info(f"Sent mod log to guild {guild.id}")
+        await channel.send(embeds=embeds)
+        logger.info(f"Sent {len(embeds)} mod log(s) to guild {guild.id}")
         return True
 
     except discord.Forbidden:
@@ -7,14 +7,13 @@ logger = setup_logger("ChecksHandler")
 
 
 OWNER_ID = int(os.getenv("OWNER_ID"))
+OWNER_IDS = frozenset({OWNER_ID})
 
 
 def is_owner_or_mod_check(interaction: discord.Interaction) -> bool:
     try:
-        if (
-            interaction.user.id == interaction.client.owner_id
-            or interaction.user.id == OWNER_ID
-        ):
+        user_id = interaction.user.id
+        if user_id == interaction.client.owner_id or user_id in OWNER_IDS:
             return True
 
         # Check if user has moderator permissions in this guild
@@ -30,10 +29,8 @@ def is_owner_or_mod_check(interaction: discord.Interaction) -> bool:
 
 def is_owner_check(interaction: discord.Interaction) -> bool:
     try:
-        if (
-            interaction.user.id == interaction.client.owner_id
-            or interaction.user.id == OWNER_ID
-        ):
+        user_id = interaction.user.id
+        if user_id == interaction.client.owner_id or user_id in OWNER_IDS:
             return True
         return False
     except Exception as e:
@@ -2,6 +2,9 @@ import discord
 
 from utils.formatting import format_number
 
+BANK_COLOR = discord.Color.blue()
+TRANSACTION_COLOR = discord.Color.green()
+
 
 def build_bank_embed(
     user: discord.User, bank_stats: dict, bank_balance: int
@@ -24,7 +27,7 @@ def build_bank_embed(
             f"🏦 Bank Capacity: ${format_number(bank_stats['bank_cap'])}\n"
             f"🏦 Bank Level: {bank_stats['bank_level']}"
         ),
-        color=discord.Color.blue(),
+        color=BANK_COLOR,
     )
 
 
@@ -50,5 +53,5 @@ def build_transaction_embed(
             f"🏦 Bank: ${format_number(new_bank)}\n"
             f"💰 Wallet: ${format_number(new_wallet)}"
         ),
-        color=discord.Color.green(),
+        color=TRANSACTION_COLOR,
     )
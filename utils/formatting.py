@@ -33,3 +33,43 @@ def clean_patchnotes(raw_changes: str) -> tuple[str, str]:
     db_formatted = ";".join(items)
     embed_formatted = "\n".join(f"- {item}" for item in items)
     return db_formatted, embed_formatted
+
+
+def smart_chunk(text: str, max_length: int = 2000) -> list[str]:
+    """
+    Split text into chunks for Discord (2000 char limit).
+    Breaks on the last paragraph, line, sentence or word boundary inside each
+    window, falling back to a hard cut when there is none.
+    """
+    if len(text) <= max_length:
+        return [text]
+
+    chunks = []
+    start = 0
+
+    while len(text) - start > max_length:
+        end = start + max_length
+
+        # Prefer paragraph, then line, then sentence, then word boundaries
+        cut = text.rfind("\n\n", start, end)
+        if cut <= start:
+            cut = text.rfind("\n", start, end)
+        if cut <= start:
+            cut = max(text.rfind(p, start, end - 1) for p in (". ", "! ", "? "))
+            if cut > start:
+                cut += 1  # Keep the punctuation with its sentence
+        if cut <= start:
+            cut = text.rfind(" ", start, end)
+        if cut <= start:
+            cut = end
+
+        chunk = text[start:cut].strip()
+        if chunk:
+            chunks.append(chunk)
+        start = cut
+
+    rest = text[start:].strip()
+    if rest:
+        chunks.append(rest)
+
+    return chunks
@@ -55,7 +55,7 @@ async def execute_gambling_game(
     prev_balance: Optional[int] = None,
     add_play_again_button: bool = True,
     play_again_label: str = "Play Again",
-    action: Optional[str] = None,
+    action: Optional[int] = None,
 ) -> None:
     """
     Unified executor for any gambling game.
@@ -70,7 +70,7 @@ async def execute_gambling_game(
         prev_balance: Optional pre-fetched balance (avoids extra DB call)
         add_play_again_button: Whether to add a "Play Again" button
         play_again_label: Custom label for play again button
-        action: Optional action string (for percentage-based bets)
+        action: Optional balance percentage (for percentage-based bets)
 
     Usage:
         await execute_gambling_game(
@@ -201,7 +201,7 @@ class GameAgainView(discord.ui.View):
         bot,
         user_id: int,
         amount: Optional[int],
-        action: Optional[str],
+        action: Optional[int],
         game_func: Callable,
         game_type: GameType,
         button_label: str = "Play Again",
@@ -0,0 +1,27 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to JSON bytes.
+    Uses orjson when installed, falling back to the stdlib json module.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def json_loads(data: bytes | str) -> Any:
+    """
+    Deserialize JSON bytes or text.
+    Uses orjson when installed, falling back to the stdlib json module.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)